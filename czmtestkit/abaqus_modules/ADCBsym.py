@@ -0,0 +1,304 @@
+# -*- coding: utf-8 -*-
+from abaqus import *
+from abaqusConstants import *
+from part import *
+from material import *
+from section import *
+from assembly import *
+from step import *
+from interaction import *
+from load import *
+from mesh import *
+from optimization import *
+from job import *
+from sketch import *
+from connectorBehavior import *
+import assembly
+import step
+import interaction
+import load
+import job
+
+def ADCBsym(dict):
+    """
+
+	**Create and submit the half-symmetry model of a symmetric Double Cantilever Beam (DCB) test with plain strain boundary conditions using Abaqus/CAE.**
+
+    .. Note:: When ``tTop == tBot`` and ``ETop == EBot`` the specimen in :numref:`ADCBschemeSym` is symmetric about the mid-plane of the cohesive zone. :func:`ADCBsym` models only the top adherand/ply and the upper half of the cohesive zone, roughly halving the model size and runtime of pure mode-I tests. It is called by :func:`ADCB` and :func:`ADCB2` when ``dict['symmetric']`` is ``True``.
+
+    The upper half of the cohesive zone (thickness :math:`t/2`) is bonded to the symmetry plane, where the translation along `E3` is fixed.
+    Since the separation across the half layer is half the separation across the full layer, the cohesive properties are adjusted such that the traction separation law of the full interface is recovered:
+
+    .. math::
+
+        K_{sym} = 2K, \\qquad G_{C_{sym}} = \\frac{G_{C}}{2}
+
+    while the nominal strengths :math:`2G_{C}/\\Delta^f` remain unchanged. Half of the opening displacement ``dict['Displacement']`` is applied to the load edge of the modelled arm.
+    The reaction force on the arm equals the reaction force of the full specimen, so :func:`czmtestkit.py_modules.Results` only doubles the extracted displacement to recover the opening when ``dict['symmetric']`` is ``True``.
+
+	:Parameters:
+
+        **dict** (`dict`): Same keys as :func:`ADCB2` (``'tBot'``, ``'EBot'`` and ``'DensityBulkBot'`` are optional and only checked for symmetry).
+
+            :'symmetric': ``True``.
+
+    .. Warning:: A ``ValueError`` is raised if the thicknesses or the engineering constants of the two adherands/plies differ.
+
+    .. _ADCBschemeSym:
+
+    .. figure:: /imgs/ADCB.png
+        :width: 500
+        :alt: ADCB schematic.
+        :align: center
+
+        **ADCB schematic** `[1]`_.
+
+        `Only the top adherand/ply and the upper half of the shaded cohesive zone are modelled.`
+
+    **References:**
+
+    .. _[1]:
+
+        1) Mudunuru, N. (2022, March 30). Finite Element Model For Interfaces In Compatibilized Polymer Blends. TU Delft Education Repositories. Retrieved on April 21, 2022, from `http://resolver.tudelft.nl/uuid:88140513-120d-4a34-b893-b84908fe2373 <http://resolver.tudelft.nl/uuid:88140513-120d-4a34-b893-b84908fe2373>`_
+
+    .. admonition:: Metadata
+
+        .. tabbed:: Environment
+
+            :badge:`Abaqus/CAE,badge-primary`
+
+        .. tabbed:: Version
+
+            v1.2.0
+
+        .. tabbed:: Date
+
+            2026-10-19
+
+    """
+    print('Running the script')
+    print(dict)
+    for k in dict.keys(): exec("{0} = dict[\'{0}\']".format(k))
+    if 'tBot' in dict.keys() and dict['tBot'] != dict['tTop']:
+        raise ValueError('tTop and tBot differ, the half-symmetry model is not applicable')
+    if 'EBot' in dict.keys() and list(dict['EBot']) != list(dict['ETop']):
+        raise ValueError('ETop and EBot differ, the half-symmetry model is not applicable')
+    NominalNormal = 2*GcNormal/gFailureNormal
+    NominalShear = 2*GcShear/gFailureShear
+    # Cohesive properties of the half layer
+    StiffnessSym = 2*StiffnessCz
+    GcNormalSym = 0.5*GcNormal
+    GcShearSym = 0.5*GcShear
+    tHalf = tCz*0.5
+    tTot = tTop + tHalf
+    # -*- coding: mbcs -*-
+    import sys
+    import os
+    sys.path.append(os.getcwd())
+    import mesh
+    from .modelOptions import bulkElemTypes, bulkSeedFactor, outputRequests, analysisStep, printRequests
+    from .caeCache import loadCaeCache, saveCaeCache
+    # Materials and sections are defined after loading, the cached model has those of the first test
+    cached = loadCaeCache(dict, 'ADCBsym')
+    elementProfile = dict.get('elementProfile', 'C3D8I')
+    viscosity = dict.get('viscosity', 0.0)
+    mdb.models['Model-1'].Material(name='Material-3')
+    mdb.models['Model-1'].materials['Material-3'].Density(table=((DensityBulkTop, ), ))
+    mdb.models['Model-1'].materials['Material-3'].Elastic(table=(ETop, ), type=
+        ENGINEERING_CONSTANTS)
+    mdb.models['Model-1'].Material(name='Material-2')
+    mdb.models['Model-1'].materials['Material-2'].Density(table=((DensityCz, ), ))
+    mdb.models['Model-1'].materials['Material-2'].Elastic(table=((StiffnessSym,
+        StiffnessSym, StiffnessSym), ), type=TRACTION)
+    mdb.models['Model-1'].materials['Material-2'].QuadsDamageInitiation(table=((
+        NominalNormal, NominalShear, NominalShear), ))
+    mdb.models['Model-1'].materials['Material-2'].quadsDamageInitiation.DamageEvolution(
+        mixedModeBehavior=BK, power=bkPower, table=((GcNormalSym, GcShearSym, GcShearSym), ), type=
+        ENERGY)
+    if viscosity != 0.0:
+        mdb.models['Model-1'].materials['Material-2'].quadsDamageInitiation.DamageStabilizationCohesive(
+            cohesiveCoeff=viscosity)
+    mdb.models['Model-1'].HomogeneousSolidSection(material='Material-3', name=
+        'Section-3', thickness=None)
+    mdb.models['Model-1'].CohesiveSection(material='Material-2', name='Section-2',
+        outOfPlaneThickness=None, response=TRACTION_SEPARATION)
+    # Geometry, mesh and assembly (skipped if a cached model is loaded)
+    if not cached:
+        mdb.models['Model-1'].ConstrainedSketch(name='__profile__', sheetSize=200.0)
+        mdb.models['Model-1'].sketches['__profile__'].rectangle(point1=(0.0, 0.0),
+            point2=(Length, 1.0))
+        mdb.models['Model-1'].Part(dimensionality=THREE_D, name='Part-1', type=
+            DEFORMABLE_BODY)
+        mdb.models['Model-1'].parts['Part-1'].BaseSolidExtrude(depth=tTot, sketch=
+            mdb.models['Model-1'].sketches['__profile__'])
+        del mdb.models['Model-1'].sketches['__profile__']
+        mdb.models['Model-1'].parts['Part-1'].DatumPlaneByPrincipalPlane(offset=Crack,
+            principalPlane=YZPLANE)
+        mdb.models['Model-1'].parts['Part-1'].DatumPlaneByPrincipalPlane(offset=tHalf,
+            principalPlane=XYPLANE)
+        mdb.models['Model-1'].parts['Part-1'].PartitionCellByDatumPlane(cells=
+            mdb.models['Model-1'].parts['Part-1'].cells.findAt(((Length*0.5, 0.5, tTot*0.5),)),
+            datumPlane=mdb.models['Model-1'].parts['Part-1'].datums[2])
+        # Removing the half cohesive layer in the crack
+        mdb.models['Model-1'].ConstrainedSketch(gridSpacing=3.01, name='__profile__',
+            sheetSize=120.46, transform=
+            mdb.models['Model-1'].parts['Part-1'].MakeSketchTransform(
+            sketchPlane=mdb.models['Model-1'].parts['Part-1'].faces.findAt(
+                coordinates=(Crack*0.5, 0.0, tTot*0.5)),
+            sketchPlaneSide=SIDE1,
+            sketchUpEdge=mdb.models['Model-1'].parts['Part-1'].edges.findAt(
+                coordinates=(0.0, 0.0, tTot*0.5)),
+            sketchOrientation=RIGHT, origin=(Crack*0.5, 0.0, tHalf*0.5)))
+        mdb.models['Model-1'].parts['Part-1'].projectReferencesOntoSketch(filter=
+            COPLANAR_EDGES, sketch=mdb.models['Model-1'].sketches['__profile__'])
+        mdb.models['Model-1'].sketches['__profile__'].rectangle(point1=(-Crack/2, -tHalf/2),
+            point2=(Crack/2, tHalf/2))
+        mdb.models['Model-1'].parts['Part-1'].CutExtrude(flipExtrudeDirection=OFF,
+            sketch=mdb.models['Model-1'].sketches['__profile__'], sketchOrientation=
+            RIGHT, sketchPlane=mdb.models['Model-1'].parts['Part-1'].faces.findAt(
+                coordinates=(Crack*0.5, 0.0, tTot*0.5)),
+            sketchPlaneSide=SIDE1, sketchUpEdge=
+            mdb.models['Model-1'].parts['Part-1'].edges.findAt(
+                coordinates=(0.0, 0.0, tTot*0.5)))
+        del mdb.models['Model-1'].sketches['__profile__']
+        mdb.models['Model-1'].parts['Part-1'].PartitionCellByDatumPlane(cells=
+            mdb.models['Model-1'].parts['Part-1'].cells.findAt((((Length+Crack)*0.5, 0.5, tTot*0.5),)),
+            datumPlane=mdb.models['Model-1'].parts['Part-1'].datums[3])
+        mdb.models['Model-1'].parts['Part-1'].Set(cells=
+            mdb.models['Model-1'].parts['Part-1'].cells.findAt((((Length+Crack)*0.5, 0.5, tTop*0.5 + tHalf),),
+                ((Crack*0.5, 0.5, tTop*0.5 + tHalf),)), name='Bulk-2')
+        mdb.models['Model-1'].parts['Part-1'].Set(cells=
+            mdb.models['Model-1'].parts['Part-1'].cells.findAt((((Length+Crack)*0.5, 0.5, tHalf*0.5),)), name='Cz')
+        mdb.models['Model-1'].parts['Part-1'].Set(edges=
+            mdb.models['Model-1'].parts['Part-1'].edges.findAt(((0.0, 0.5, tTot),)), name='Top')
+        mdb.models['Model-1'].parts['Part-1'].Set(faces=
+            mdb.models['Model-1'].parts['Part-1'].faces.findAt((((Length+Crack)*0.5, 0.5, 0.0),)), name='Sym')
+        mdb.models['Model-1'].parts['Part-1'].Set(edges=
+            mdb.models['Model-1'].parts['Part-1'].edges.findAt((((Length+Crack)*0.5, 0.0, 0.0),),
+                (((Length+Crack)*0.5, 0.0, tHalf),),
+                (((Length+Crack)*0.5, 0.0, tTot),),
+                (((Length+Crack)*0.5, 1.0, 0.0),),
+                (((Length+Crack)*0.5, 1.0, tHalf),),
+                (((Length+Crack)*0.5, 1.0, tTot),)), name='XEdges')
+        mdb.models['Model-1'].parts['Part-1'].Set(edges=
+            mdb.models['Model-1'].parts['Part-1'].edges.findAt(((Crack*0.5, 0.0, tHalf),),
+                ((Crack*0.5, 0.0, tTot),),
+                ((Crack*0.5, 1.0, tHalf),),
+                ((Crack*0.5, 1.0, tTot),)), name='XCrack')
+        mdb.models['Model-1'].parts['Part-1'].Set(edges=
+            mdb.models['Model-1'].parts['Part-1'].edges.findAt(((0.0, 0.5, tHalf),),
+                ((0.0, 0.5, tTot),),
+                ((Crack, 0.5, 0.0),),
+                ((Crack, 0.5, tHalf),),
+                ((Crack, 0.5, tTot),),
+                ((Length, 0.5, 0.0),),
+                ((Length, 0.5, tHalf),),
+                ((Length, 0.5, tTot),)), name='YEdges')
+        mdb.models['Model-1'].parts['Part-1'].Set(edges=
+            mdb.models['Model-1'].parts['Part-1'].edges.findAt(((0.0, 0.0, tTot - tTop*0.5),),
+                ((Crack, 0.0, tTot - tTop*0.5),),
+                ((Length, 0.0, tTot - tTop*0.5),),
+                ((0.0, 1.0, tTot - tTop*0.5),),
+                ((Crack, 1.0, tTot - tTop*0.5),),
+                ((Length, 1.0, tTot - tTop*0.5),)), name='ZEdges')
+        mdb.models['Model-1'].parts['Part-1'].Set(faces=
+            mdb.models['Model-1'].parts['Part-1'].faces.findAt((((Length+Crack)*0.5, 0.0, tTop*0.5 + tHalf),),
+                ((Crack*0.5, 0.0, tTop*0.5 + tHalf),),
+                (((Length+Crack)*0.5, 1.0, tTop*0.5 + tHalf),),
+                ((Crack*0.5, 1.0, tTop*0.5 + tHalf),)), name='Sides')
+        mdb.models['Model-1'].parts['Part-1'].SectionAssignment(offset=0.0,
+            offsetField='', offsetType=MIDDLE_SURFACE, region=
+            mdb.models['Model-1'].parts['Part-1'].sets['Bulk-2'], sectionName='Section-3'
+            , thicknessAssignment=FROM_SECTION)
+        mdb.models['Model-1'].parts['Part-1'].SectionAssignment(offset=0.0,
+            offsetField='', offsetType=MIDDLE_SURFACE, region=
+            mdb.models['Model-1'].parts['Part-1'].sets['Cz'], sectionName='Section-2',
+            thicknessAssignment=FROM_SECTION)
+        mdb.models['Model-1'].parts['Part-1'].MaterialOrientation(
+            additionalRotationType=ROTATION_NONE, axis=AXIS_1, fieldName='', localCsys=
+            None, orientationType=GLOBAL, region=
+            mdb.models['Model-1'].parts['Part-1'].sets['Bulk-2'], stackDirection=STACK_3)
+        mdb.models['Model-1'].parts['Part-1'].seedEdgeBySize(constraint=FINER,
+            deviationFactor=0.1, edges=
+            mdb.models['Model-1'].parts['Part-1'].sets['XCrack'].edges, size=MeshCrack)
+        mdb.models['Model-1'].parts['Part-1'].seedEdgeBySize(constraint=FINER,
+            deviationFactor=0.1, edges=
+            mdb.models['Model-1'].parts['Part-1'].sets['XEdges'].edges, size=MeshX)
+        mdb.models['Model-1'].parts['Part-1'].seedEdgeBySize(constraint=FINER,
+            deviationFactor=0.1, edges=
+            mdb.models['Model-1'].parts['Part-1'].sets['YEdges'].edges, size=1.0)
+        mdb.models['Model-1'].parts['Part-1'].seedEdgeBySize(constraint=FINER,
+            deviationFactor=0.1, edges=
+            mdb.models['Model-1'].parts['Part-1'].sets['ZEdges'].edges, size=MeshZ*bulkSeedFactor(elementProfile))
+        mdb.models['Model-1'].parts['Part-1'].setElementType(elemTypes=(ElemType(
+            elemCode=COH3D8, elemLibrary=STANDARD), ElemType(elemCode=COH3D6,
+            elemLibrary=STANDARD), ElemType(elemCode=UNKNOWN_TET,
+            elemLibrary=STANDARD)), regions=(
+            mdb.models['Model-1'].parts['Part-1'].sets['Cz'].cells, ))
+        elemType1, elemType2, elemType3 = bulkElemTypes(elementProfile)
+        mdb.models['Model-1'].parts['Part-1'].setElementType(regions=(
+            mdb.models['Model-1'].parts['Part-1'].sets['Bulk-2'].cells, ),
+            elemTypes=(elemType1, elemType2, elemType3))
+        mdb.models['Model-1'].parts['Part-1'].generateMesh()
+        mdb.models['Model-1'].rootAssembly.DatumCsysByDefault(CARTESIAN)
+        mdb.models['Model-1'].rootAssembly.Instance(dependent=ON, name='Part-1-1',
+            part=mdb.models['Model-1'].parts['Part-1'])
+        TopRP = mdb.models['Model-1'].rootAssembly.ReferencePoint(point=
+            mdb.models['Model-1'].rootAssembly.instances['Part-1-1'].InterestingPoint(
+            mdb.models['Model-1'].rootAssembly.instances['Part-1-1'].sets['Top'].edges[0],
+            MIDDLE))
+        mdb.models['Model-1'].rootAssembly.Set(name='TopL', referencePoints=(
+            mdb.models['Model-1'].rootAssembly.referencePoints[TopRP.id], ))
+        saveCaeCache(dict, 'ADCBsym')
+    analysisStep(dict, 'TopL', Displacement*0.5)
+    outputRequests(dict, 'TopL')
+    mdb.models['Model-1'].Coupling(controlPoint=
+        mdb.models['Model-1'].rootAssembly.sets['TopL'], couplingType=KINEMATIC,
+        influenceRadius=WHOLE_SURFACE, localCsys=None, name='Constraint-2',
+        surface=mdb.models['Model-1'].rootAssembly.instances['Part-1-1'].sets['Top'], u1=ON
+        , u2=ON, u3=ON, ur1=OFF, ur2=OFF, ur3=OFF)
+    mdb.models['Model-1'].rootAssembly.regenerate()
+    mdb.models['Model-1'].ZsymmBC(createStepName='Step-1', localCsys=None, name=
+        'BC-1', region=
+        mdb.models['Model-1'].rootAssembly.instances['Part-1-1'].sets['Sym'])
+    mdb.models['Model-1'].DisplacementBC(amplitude=UNSET, createStepName='Step-1',
+        distributionType=UNIFORM, fieldName='', fixed=OFF, localCsys=None, name=
+        'BC-2', region=mdb.models['Model-1'].rootAssembly.sets['TopL'], u1=0.0, u2=
+        UNSET, u3=0.0, ur1=UNSET, ur2=UNSET, ur3=UNSET)
+    mdb.models['Model-1'].DisplacementBC(amplitude=UNSET, createStepName='Step-1',
+        distributionType=UNIFORM, fieldName='', fixed=OFF, localCsys=None, name=
+        'BC-3', region=
+        mdb.models['Model-1'].rootAssembly.instances['Part-1-1'].sets['Sides'], u1=
+        UNSET, u2=0.0, u3=UNSET, ur1=UNSET, ur2=UNSET, ur3=UNSET)
+    # Half of the opening displacement is applied to the modelled arm
+    mdb.models['Model-1'].boundaryConditions['BC-2'].setValues(u3=Displacement*0.5)
+    Name = JobID.encode('ascii','ignore')
+    printRequests(dict, 'TopL')
+    mdb.Job(name=Name, model='Model-1', description='', type=ANALYSIS,
+		atTime=None, waitMinutes=0, waitHours=0, queue=None, memory=90,
+		memoryUnits=PERCENTAGE, getMemoryFromAnalysis=True,
+		explicitPrecision=SINGLE, nodalOutputPrecision=SINGLE, echoPrint=OFF,
+		modelPrint=OFF, contactPrint=OFF, historyPrint=OFF, userSubroutine='',
+		scratch='', resultsFormat=ODB, multiprocessingMode=DEFAULT, numCpus=nCpu, numDomains=nCpu, numGPUs=nGpu)
+    if userSub['type']=='UEL':
+        mdb.jobs[Name].writeInput(consistencyChecking=OFF)
+        userSub['prop'] = [StiffnessSym, NominalNormal, NominalShear, GcNormalSym, GcShearSym, bkPower]
+        from .uelDef import ReDefCE
+        ReDefCE(Name, userSub['prop'], userSub['intProp'], CzField=userSub.get('propField'), buckets=userSub.get('buckets', 16))
+        # Deleting old job defintion
+        del mdb.jobs[Name]
+        import shutil
+        shutil.copyfile(userSub['path'], 'subRout.for')
+        mdb.JobFromInputFile(name=Name,
+            inputFileName=os.path.join(os.getcwd(),Name),
+            type=ANALYSIS, atTime=None, waitMinutes=0, waitHours=0, queue=None,
+            memory=90, memoryUnits=PERCENTAGE, getMemoryFromAnalysis=True,
+            explicitPrecision=SINGLE, nodalOutputPrecision=SINGLE,
+            userSubroutine='subRout.for',
+            scratch='', resultsFormat=ODB, multiprocessingMode=DEFAULT,
+            numCpus=nCpu, numDomains=nCpu, numGPUs=nGpu)
+    if submit is True:
+        mdb.jobs[Name].submit(consistencyChecking=OFF)
+        mdb.jobs[Name].waitForCompletion()
+    elif userSub['type']!='UEL':
+        mdb.jobs[Name].writeInput(consistencyChecking=OFF)
@@ -8,4 +8,7 @@ from .ASLB2 import *
 from .postProc import *
 from .uelDef import *
 from .ADCB import *
-from .ASLB import *
\ No newline at end of file
+from .ASLB import *
+from .ADCBsym import *
+from .modelOptions import *
+from .caeCache import *
\ No newline at end of file
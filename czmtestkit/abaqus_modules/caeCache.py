@@ -0,0 +1,137 @@
+# -*- coding: utf-8 -*-
+## Cache of the meshed models shared by the abaqus_modules test functions
+from abaqus import *
+from abaqusConstants import *
+
+# Input parameters defining the geometry and the mesh of the test functions
+GeometryKeys = ['Length', 'tTop', 'tBot', 'tCz', 'Crack', 'MeshCrack', 'MeshX', 'MeshZ', 'elementProfile']
+
+def caeCachePath(dict, function):
+    """
+	**Path of the cached model database of a test function for the geometry and mesh parameters in** `dict`.
+
+	:Parameters:
+
+		**dict** (`dict`): Input dictionary of the test function.
+
+			:'caeCache': ``True``: the cache directory ``caeCache`` is created next to the test directories of the design of experiments. `str`: path of the cache directory. ``False``: no cache [optional, default ``False``].
+
+		**function** (`str`): Name of the test function.
+
+	:return:
+
+		(`str`) Path of the ``.cae`` file named after a hash of `function` and the values of the ``GeometryKeys`` in `dict`. ``None`` if the cache is not used.
+
+	Only `function` and the ``GeometryKeys`` (``'Length'``, ``'tTop'``, ``'tBot'``, ``'tCz'``, ``'Crack'``, ``'MeshCrack'``, ``'MeshX'``, ``'MeshZ'`` and ``'elementProfile'``) are part of the key.
+	All other keys, e.g. the material and cohesive properties, ``'viscosity'``, ``'Displacement'``, the step and output options and ``'userSub'``, are excluded, since the models with these inputs are defined by the test function after the cached model is loaded.
+
+    .. admonition:: Metadata
+
+        .. tabbed:: Environment
+
+            :badge:`Abaqus/CAE,badge-primary`
+
+        .. tabbed:: Version
+
+            v1.2.0
+
+        .. tabbed:: Date
+
+            2026-10-19
+
+    """
+    import os
+    import json
+    import hashlib
+    cache = dict.get('caeCache', False)
+    if cache is False or cache is None:
+        return None
+    if cache is True:
+        cache = os.path.join(os.path.dirname(os.getcwd()), 'caeCache')
+    Values = [function] + [dict.get(key) for key in GeometryKeys]
+    key = hashlib.sha1(json.dumps(Values, sort_keys=True).encode('utf-8')).hexdigest()[:16]
+    return os.path.join(cache, function + '_' + key + '.cae')
+
+def loadCaeCache(dict, function):
+    """
+	**Replace** ``Model-1`` **with the cached meshed model of a test function, if it exists.**
+
+	The cached model contains the part with sets, section assignments, material orientations and mesh, and the assembly with instance, reference points and sets.
+	Materials, sections, steps, output requests, constraints, boundary conditions and the job are defined by the test function for each test.
+	The function must be called before the materials and sections are defined, since the materials and sections saved with the cached model (those of the test it was saved from) are deleted on loading. The section assignments refer to the sections by name and apply to the sections defined afterwards with the values of the current test.
+
+	:Parameters:
+
+		**dict** (`dict`): Input dictionary of the test function. See :func:`caeCachePath`.
+
+		**function** (`str`): Name of the test function.
+
+	:return:
+
+		(`bool`) ``True`` if the model was loaded from the cache.
+
+    .. admonition:: Metadata
+
+        .. tabbed:: Environment
+
+            :badge:`Abaqus/CAE,badge-primary`
+
+        .. tabbed:: Version
+
+            v1.2.0
+
+        .. tabbed:: Date
+
+            2026-10-19
+
+    """
+    import os
+    path = caeCachePath(dict, function)
+    if path is None or not os.path.exists(path):
+        return False
+    print('Loading the meshed model from ' + path)
+    mdb.openAuxMdb(pathName=path)
+    mdb.copyAuxMdbModel(fromName='Model-1', toName='Model-Cache')
+    mdb.closeAuxMdb()
+    del mdb.models['Model-1']
+    mdb.models.changeKey(fromName='Model-Cache', toName='Model-1')
+    # Materials and sections of the test the cache was saved from, redefined by the test function
+    model = mdb.models['Model-1']
+    for name in model.sections.keys():
+        del model.sections[name]
+    for name in model.materials.keys():
+        del model.materials[name]
+    return True
+
+def saveCaeCache(dict, function):
+    """
+	**Save the meshed model of a test function to the cache.**
+
+	:Parameters:
+
+		**dict** (`dict`): Input dictionary of the test function. See :func:`caeCachePath`.
+
+		**function** (`str`): Name of the test function.
+
+    .. admonition:: Metadata
+
+        .. tabbed:: Environment
+
+            :badge:`Abaqus/CAE,badge-primary`
+
+        .. tabbed:: Version
+
+            v1.2.0
+
+        .. tabbed:: Date
+
+            2026-10-19
+
+    """
+    import os
+    path = caeCachePath(dict, function)
+    if path is None or os.path.exists(path):
+        return
+    if not os.path.exists(os.path.dirname(path)):
+        os.makedirs(os.path.dirname(path))
+    mdb.saveAs(pathName=path)
@@ -0,0 +1,311 @@
+# -*- coding: utf-8 -*-
+## Optional model settings shared by the abaqus_modules test functions
+from abaqus import *
+from abaqusConstants import *
+import mesh
+
+# Element technology used for the bulk adherands/plies
+ElementProfiles = {
+    'C3D8I': {'seedFactor': 1.0},
+    'C3D8R': {'seedFactor': 1.0},
+    'C3D20R': {'seedFactor': 2.0},
+}
+
+# Field output variables requested by each output profile
+OutputProfiles = {
+    'minimal': (),
+    'damage': ('SDEG', 'STATUS', 'S'),
+    'full': ('S', 'SEQUT', 'LE', 'TE', 'TEEQ', 'TEVOL', 'EEQUT', 'U', 'RF', 'SDEG',
+        'SDV', 'STATUS'),
+}
+
+def bulkElemTypes(profile='C3D8I'):
+    """
+	**Element types for the bulk adherands/plies corresponding to an element profile.**
+
+	:Parameters:
+
+		**profile** (`str`): Name of the element profile.
+
+			``'C3D8I'``: Incompatible mode hexahedra (default). Most accurate in bending per element and the most expensive per element.
+
+			``'C3D8R'``: Reduced integration hexahedra with enhanced hourglass control.
+
+			``'C3D20R'``: Quadratic reduced integration hexahedra with the through-thickness seed size scaled by the ``seedFactor`` of the profile (see :func:`bulkSeedFactor`).
+
+	:return:
+
+		(`tuple`) Hexahedral, wedge and tetrahedral ``ElemType`` objects to be passed to ``setElementType``.
+
+    .. Warning:: The cohesive elements only share the corner nodes of ``C3D20R`` faces at the interface. Compare the profile with the default using :func:`czmtestkit.py_modules.profileBenchmark` before using it in a design of experiments.
+
+    .. admonition:: Metadata
+
+        .. tabbed:: Environment
+
+            :badge:`Abaqus/CAE,badge-primary`
+
+        .. tabbed:: Version
+
+            v1.2.0
+
+        .. tabbed:: Date
+
+            2026-10-19
+
+    """
+    if profile not in ElementProfiles:
+        raise ValueError('Unknown element profile ' + str(profile) + ', use one of ' + str(sorted(ElementProfiles.keys())))
+    if profile == 'C3D8R':
+        elemType1 = mesh.ElemType(elemCode=C3D8R, elemLibrary=STANDARD,
+            kinematicSplit=AVERAGE_STRAIN, secondOrderAccuracy=OFF,
+            hourglassControl=ENHANCED, distortionControl=DEFAULT)
+        elemType2 = mesh.ElemType(elemCode=C3D6, elemLibrary=STANDARD)
+        elemType3 = mesh.ElemType(elemCode=C3D4, elemLibrary=STANDARD)
+    elif profile == 'C3D20R':
+        elemType1 = mesh.ElemType(elemCode=C3D20R, elemLibrary=STANDARD)
+        elemType2 = mesh.ElemType(elemCode=C3D15, elemLibrary=STANDARD)
+        elemType3 = mesh.ElemType(elemCode=C3D10, elemLibrary=STANDARD)
+    else:
+        elemType1 = mesh.ElemType(elemCode=C3D8I, elemLibrary=STANDARD,
+            secondOrderAccuracy=OFF, distortionControl=DEFAULT)
+        elemType2 = mesh.ElemType(elemCode=C3D6, elemLibrary=STANDARD)
+        elemType3 = mesh.ElemType(elemCode=C3D4, elemLibrary=STANDARD)
+    return (elemType1, elemType2, elemType3)
+
+def bulkSeedFactor(profile='C3D8I'):
+    """
+	**Multiplier for the through-thickness seed size** ``MeshZ`` **of the bulk adherands/plies corresponding to an element profile.**
+
+	The seed sizes along the interface (``MeshCrack`` and ``MeshX``) are governed by the length of the cohesive process zone and are not scaled.
+
+	:Parameters:
+
+		**profile** (`str`): Name of the element profile. See :func:`bulkElemTypes`.
+
+	:return:
+
+		(`float`) Seed size multiplier.
+
+    .. admonition:: Metadata
+
+        .. tabbed:: Environment
+
+            :badge:`Abaqus/CAE,badge-primary`
+
+        .. tabbed:: Version
+
+            v1.2.0
+
+        .. tabbed:: Date
+
+            2026-10-19
+
+    """
+    if profile not in ElementProfiles:
+        raise ValueError('Unknown element profile ' + str(profile) + ', use one of ' + str(sorted(ElementProfiles.keys())))
+    return ElementProfiles[profile]['seedFactor']
+
+def analysisStep(dict, loadSet, target):
+    """
+	**Create the analysis step** ``Step-1`` **of** ``Model-1`` **corresponding to a step type.**
+
+	:Parameters:
+
+		**dict** (`dict`): Input dictionary of the test function.
+
+			:'stepType': Name of the step type [optional, default ``'dynamic'``].
+
+				``'dynamic'``: Implicit dynamic step with quasi-static application.
+
+				``'riks'``: Static Riks (arc-length) step for unstable crack growth. The applied displacement is the reference load, scaled by the load proportionality factor, and the step ends when the displacement of `loadSet` reaches `target`.
+
+				``'stabilized'``: Static general step with automatic stabilization based on the dissipated energy fraction. The viscous dissipation ``ALLSD`` and the internal energy ``ALLIE`` of the whole model are requested as history output ``H-Output-2`` to check the stabilization.
+
+			:'stabilization': Dissipated energy fraction of ``'stabilized'`` [optional, default ``0.0002``].
+
+			:'maxArcInc': Maximum arc length increment of ``'riks'`` [optional, default ``0.1``].
+
+			:'initialInc': Initial increment of ``'dynamic'`` and ``'stabilized'`` [optional, default ``0.1``].
+
+			:'maxInc': Maximum increment of ``'dynamic'`` and ``'stabilized'`` [optional, default ``0.1``].
+
+			:'timeIncrementation': Time incrementation control parameters :math:`(I_0, I_R, I_P, I_C, I_L, I_G, I_S, I_A, I_J, I_T, S_C)` [optional]. See :func:`czmtestkit.py_modules.incrementTuner` to propose ``'initialInc'``, ``'maxInc'`` and ``'timeIncrementation'`` from completed points.
+
+			:'displacementField': Field equation control parameters of the displacement [optional].
+
+		**loadSet** (`str`): Name of the assembly set where the displacement is applied.
+
+		**target** (`float`): Applied displacement of `loadSet` along `U3`.
+
+    .. Note:: The history output ``UT`` and ``RT`` of the load point (see :func:`outputRequests`) is available in all the step types, so :func:`historyOutput` and :func:`czmtestkit.py_modules.Results` are used the same way.
+
+    .. admonition:: Metadata
+
+        .. tabbed:: Environment
+
+            :badge:`Abaqus/CAE,badge-primary`
+
+        .. tabbed:: Version
+
+            v1.2.0
+
+        .. tabbed:: Date
+
+            2026-10-19
+
+    """
+    stepType = dict.get('stepType', 'dynamic')
+    initialInc = dict.get('initialInc', 0.1)
+    maxInc = dict.get('maxInc', 0.1)
+    timeIncrementation = tuple(dict.get('timeIncrementation', (200.0, 200.0, 9.0,
+        200.0, 200.0, 4.0, 20.0, 50.0, 6.0, 3.0, 50.0)))
+    displacementField = tuple(dict.get('displacementField', (0.05, 1.0, 0.0, 0.0,
+        0.02, 1e-05, 0.001, 1e-08, 1.0, 1e-05, 1e-08)))
+    model = mdb.models['Model-1']
+    if stepType == 'riks':
+        model.StaticRiksStep(name='Step-1', previous='Initial', nlgeom=ON,
+            initialArcInc=0.01, maxArcInc=dict.get('maxArcInc', 0.1),
+            maxNumInc=1000000000, matrixStorage=UNSYMMETRIC, nodeOn=ON,
+            maximumDisplacement=target, dof=3, region=model.rootAssembly.sets[loadSet])
+    elif stepType == 'stabilized':
+        model.StaticStep(name='Step-1', previous='Initial', nlgeom=ON,
+            initialInc=initialInc, maxInc=maxInc, maxNumInc=1000000000, minInc=1e-15,
+            matrixStorage=UNSYMMETRIC, stabilizationMethod=DISSIPATED_ENERGY_FRACTION,
+            stabilizationMagnitude=dict.get('stabilization', 0.0002),
+            continueDampingFactors=False, adaptiveDampingRatio=0.05)
+        model.HistoryOutputRequest(name='H-Output-2', createStepName='Step-1',
+            variables=('ALLSD', 'ALLIE'))
+    elif stepType == 'dynamic':
+        model.ImplicitDynamicsStep(alpha=DEFAULT, amplitude=RAMP,
+            application=QUASI_STATIC, initialConditions=OFF, initialInc=initialInc,
+            matrixStorage=UNSYMMETRIC, maxInc=maxInc, maxNumInc=1000000000, name='Step-1',
+            nlgeom=ON, nohaf=OFF, previous='Initial')
+    else:
+        raise ValueError('Unknown step type ' + str(stepType) + ", use one of ['dynamic', 'riks', 'stabilized']")
+    model.steps['Step-1'].control.setValues(allowPropagation=OFF,
+        resetDefaultValues=OFF, displacementField=displacementField,
+        timeIncrementation=timeIncrementation, electricalPotentialField=DEFAULT, hydrostaticFluidPressureField=DEFAULT, rotationField=DEFAULT,
+        lineSearch=(4.0, 4.0, 0.25, 0.25, 0.15))
+
+def outputRequests(dict, historySet):
+    """
+	**Set the history and field output requests of** ``Model-1`` **corresponding to an output profile.**
+
+	The history output of ``UT`` and ``RT`` at the load point is requested in all profiles, as required by :func:`historyOutput`.
+	The field output request ``F-Output-1`` depends on the profile, which limits the solver I/O, the size of the ``.odb`` file and the extraction time to the data that is post-processed.
+
+	:Parameters:
+
+		**dict** (`dict`): Input dictionary of the test function.
+
+			:'outputProfile': Name of the output profile [optional, default ``'full'``].
+
+				``'minimal'``: History output only. ``F-Output-1`` is deleted.
+
+				``'damage'``: ``SDEG``, ``STATUS`` and the tractions ``S`` on the cohesive zone (instance set ``Cz``), see :func:`interfaceDamage`. Since user elements do not write to the ``.odb`` file, use ``'minimal'`` with ``'UEL'``.
+
+				``'full'``: ``S, SEQUT, LE, TE, TEEQ, TEVOL, EEQUT, U, RF, SDEG, SDV, STATUS`` on the whole model.
+
+			:'outputRegion': Name of an instance set to which the field output is restricted [optional, overrides the default region of the profile].
+
+			:'outputFrequency': Field output frequency in increments, or ``'last'`` for the last increment of the step only [optional, default ``1``].
+
+			:'historyFrequency': History output frequency in increments [optional, default ``1``].
+
+			:'restart': ``True``: restart data of the last increment of the step is written (overlayed) to continue the analysis with :func:`czmtestkit.py_modules.continue_sim` [optional, default ``False``].
+
+		**historySet** (`str`): Name of the assembly set of the load point.
+
+    .. admonition:: Metadata
+
+        .. tabbed:: Environment
+
+            :badge:`Abaqus/CAE,badge-primary`
+
+        .. tabbed:: Version
+
+            v1.2.0
+
+        .. tabbed:: Date
+
+            2026-10-19
+
+    """
+    profile = dict.get('outputProfile', 'full')
+    if profile not in OutputProfiles:
+        raise ValueError('Unknown output profile ' + str(profile) + ', use one of ' + str(sorted(OutputProfiles.keys())))
+    model = mdb.models['Model-1']
+    model.historyOutputRequests['H-Output-1'].setValues(frequency=
+        dict.get('historyFrequency', 1), rebar=EXCLUDE, region=
+        model.rootAssembly.sets[historySet], sectionPoints=DEFAULT,
+        variables=('UT', 'RT'))
+    if dict.get('restart') is True:
+        model.steps['Step-1'].Restart(numberIntervals=1, overlay=ON,
+            timeMarks=OFF)
+    if profile == 'minimal':
+        del model.fieldOutputRequests['F-Output-1']
+        return
+    frequency = dict.get('outputFrequency', 1)
+    if frequency == 'last':
+        frequency = LAST_INCREMENT
+    region = dict.get('outputRegion')
+    if region is None and profile == 'damage':
+        region = 'Cz'
+    if region is None:
+        model.fieldOutputRequests['F-Output-1'].setValues(frequency=frequency,
+            variables=OutputProfiles[profile])
+    else:
+        model.fieldOutputRequests['F-Output-1'].setValues(frequency=frequency,
+            region=model.rootAssembly.instances['Part-1-1'].sets[region],
+            variables=OutputProfiles[profile])
+
+def printRequests(dict, historySet):
+    """
+	**Add output requests to the** ``.dat`` **and** ``.fil`` **files to the keywords of** ``Model-1``.
+
+	The requests are inserted before ``*End Step`` with the keyword editor, after the model is complete, and are read without Abaqus with :func:`czmtestkit.py_modules.datResults` and :func:`czmtestkit.py_modules.filIncrements`.
+
+	:Parameters:
+
+		**dict** (`dict`): Input dictionary of the test function.
+
+			:'nodePrint': ``True``: ``*Node Print`` of ``RF`` and ``U`` at the load point is requested with the frequency ``'historyFrequency'`` (see :func:`outputRequests`) [optional, default ``False``].
+
+			:'filOutput': ``'ascii'`` or ``'binary'``: ``U`` and ``RF`` at the load point and, except for user elements, ``SDEG``, ``STATUS`` and ``S`` on the cohesive zone are written to the results file ``.fil`` in this format with the frequency ``'historyFrequency'``, to be read with :func:`czmtestkit.py_modules.filIncrements` [optional, default ``False``].
+
+		**historySet** (`str`): Name of the assembly set of the load point.
+
+    .. admonition:: Metadata
+
+        .. tabbed:: Environment
+
+            :badge:`Abaqus/CAE,badge-primary`
+
+        .. tabbed:: Version
+
+            v1.2.0
+
+        .. tabbed:: Date
+
+            2026-10-19
+
+    """
+    Keywords = []
+    if dict.get('nodePrint') is True:
+        Keywords.append('*Node Print, nset='+historySet+', frequency='+str(dict.get('historyFrequency', 1))+', summary=NO, totals=NO\nRF, U')
+    filOutput = dict.get('filOutput', False)
+    if filOutput in ['ascii', 'binary']:
+        frequency = str(dict.get('historyFrequency', 1))
+        if filOutput == 'ascii':
+            Keywords.append('*File Format, ASCII')
+        Keywords.append('*Node File, nset='+historySet+', frequency='+frequency+'\nU, RF')
+        if dict.get('userSub', {}).get('type') != 'UEL':
+            Keywords.append('*El File, elset=Part-1-1.Cz, frequency='+frequency+'\nSDEG, STATUS, S')
+    if len(Keywords) == 0:
+        return
+    model = mdb.models['Model-1']
+    model.keywordBlock.synchVersions(storeNodesAndElements=False)
+    blocks = model.keywordBlock.sljBlocks
+    position = [i for i in range(len(blocks)) if blocks[i].lower().startswith('*end step')][0]
+    model.keywordBlock.insert(position-1, '\n'.join(Keywords))
@@ -2,6 +2,7 @@
 ## Importing abaqus libraries for postprocessing
 from odbAccess import openOdb
 import odbAccess
+from abaqusConstants import CENTROID
 
 def historyOutput(dict):
     """
@@ -13,6 +14,13 @@ def historyOutput(dict):
 
             :'JobID': name of the ``.odb`` file.
 
+            :'historyFormat': ``'csv'``: the history output is written to ``.csv`` files. ``'npz'``: the history output is written to ``<JobID>.npz``. ``'both'``: both formats [optional, default ``'csv'``].
+
+    Each history output is read as an array in one call for each step.
+    ``<JobID>.npz`` contains one array for each history output with the key ``'<region>:<output>'``, e.g. ``'Node ASSEMBLY.2:RF3'``, and the total time and the value in full precision as columns.
+
+    History outputs without components, such as the energies ``ALLSD`` and ``ALLIE`` or the load proportionality factor ``LPF`` (see :func:`analysisStep`), are written to ``<JobID>_model.csv`` with the region and the output name as header rows, which keeps the reaction force and displacement in ``<JobID>.csv`` readable by :func:`czmtestkit.py_modules.Results`.
+
     .. dropdown:: Example
 
         If reaction force and displacement at Node 2 of the assembly are requested as history output to ``ExampleJob.odb``, then executing the following:
@@ -53,7 +61,11 @@ def historyOutput(dict):
 
         .. tabbed:: Version
             
-            v1.0.0
+            ==========  =====
+            **v1.2.0**  Added ``historyFormat``.
+
+            v1.0.0      Initial release.
+            ==========  =====
 
         .. tabbed:: Date
             
@@ -69,35 +81,168 @@ def historyOutput(dict):
 
     """
     import csv
+    import numpy as np
 
     Name = dict['JobID'].encode('ascii','ignore')
-    Output = []
+    historyFormat = dict.get('historyFormat', 'csv')
     Database = openOdb(Name+'.odb')
     StepKey = Database.steps.keys()
     SetKey = []
     OutKey = []
-    Set = Database.steps['Step-1'].historyRegions.keys()
+    Set = Database.steps[StepKey[0]].historyRegions.keys()
+    ModelSetKey = []
+    ModelOutKey = []
+    Arrays = {}
     for s in Set:
-        Out =  Database.steps['Step-1'].historyRegions[s].historyOutputs.keys()
+        Out =  Database.steps[StepKey[0]].historyRegions[s].historyOutputs.keys()
         for o in Out:
-            SetKey.append(s)
-            OutKey.append(o)
+            # Outputs without components (energies, LPF) are written separately
+            if o[-1].isdigit():
+                SetKey.append(s)
+                OutKey.append(o)
+            else:
+                ModelSetKey.append(s)
+                ModelOutKey.append(o)
+            # Time and value of all steps, with the total time at the start of each step added to the step time
+            Data = []
+            for j in StepKey:
+                step = Database.steps[j]
+                Out_raw = np.array(step.historyRegions[s].historyOutputs[o].data, dtype=float).reshape(-1, 2)
+                Out_raw[:,0] = Out_raw[:,0] + step.totalTime
+                Data.append(Out_raw)
+            Arrays[s+':'+o] = np.concatenate(Data)
+    Database.close()
+    if historyFormat in ['npz', 'both']:
+        np.savez(Name+'.npz', **Arrays)
+    if historyFormat not in ['csv', 'both']:
+        return
     with open(Name+'.csv', mode='w') as file:
         writer = csv.writer(file)
-        for i in range(len(SetKey)):
-            Out_dat = []
-            for j in StepKey:
-                Out_raw = Database.steps[j].historyRegions[SetKey[i]].historyOutputs[OutKey[i]].data
-                Out = [float(row[1]) for row in Out_raw]
-                Out_dat.extend(Out)
-            Out = [SetKey[i]]
-            Out.append(OutKey[i][:-1])
-            Out.append(OutKey[i][-1])
-            Out = Out + Out_dat
-            Output.append(Out)
-        for j in range(len(Output[0])):
-            row = []
-            for i in range(len(Output)):
-                row.append(Output[i][j])
-            writer.writerow(row)
-    Database.close()
\ No newline at end of file
+        writer.writerow(SetKey)
+        writer.writerow([o[:-1] for o in OutKey])
+        writer.writerow([o[-1] for o in OutKey])
+        writer.writerows(np.column_stack([Arrays[SetKey[i]+':'+OutKey[i]][:,1] for i in range(len(SetKey))]).tolist())
+    if len(ModelOutKey) != 0:
+        with open(Name+'_model.csv', mode='w') as file:
+            writer = csv.writer(file)
+            writer.writerow(ModelSetKey)
+            writer.writerow(ModelOutKey)
+            writer.writerows(np.column_stack([Arrays[ModelSetKey[i]+':'+ModelOutKey[i]][:,1] for i in range(len(ModelSetKey))]).tolist())
+
+def interfaceDamage(dict):
+    """
+	**Extract the damage, status and tractions of the cohesive zone from the** ``.odb`` **file frame by frame.**
+
+	The field outputs ``SDEG``, ``STATUS`` and ``S`` (tractions) at the centroids of the elements of the cohesive zone are read for one frame at a time with ``bulkDataBlocks`` and written to ``.npy`` files opened as memory-mapped arrays, so the frames are not held in memory.
+	Use the output profile ``'damage'`` (see :func:`outputRequests`) to request these outputs.
+
+	:Parameters:
+
+		**dict** (`dict`):
+
+			:'JobID': name of the ``.odb`` file.
+
+			:'interfaceSet': Element set of the cohesive zone in the instance ``Part-1-1`` [optional, default ``'Cz'``].
+
+			:'damageLimit': ``SDEG`` from which an element is considered failed [optional, default 0.99].
+
+	Output files:
+
+		``<JobID>_interface_SDEG.npy``, ``<JobID>_interface_STATUS.npy``: (frames × elements) arrays.
+
+		``<JobID>_interface_S.npy``: (frames × elements × components) array of the tractions, with the components of the cohesive elements, e.g. ``S33``, ``S13`` and ``S23`` for ``COH3D8``.
+
+		``<JobID>_interface.npz``: ``'Elements'`` labels, ``'Centroids'`` coordinates of the element centroids in the undeformed configuration, ``'Time'`` total time of each frame, ``'SLabels'`` component labels of the tractions, ``'Failed'`` and ``'ProcessZone'`` minimum and maximum x-coordinate of the failed elements and of the damaged elements that have not failed in each frame (``nan`` if there are none).
+
+	.. dropdown:: Example
+
+		.. code-block:: python
+
+			interfaceDamage({'JobID':'ExampleJob'})
+
+		then, with Python
+
+		.. code-block:: python
+
+			import numpy as np
+			Interface = np.load('ExampleJob_interface.npz')
+			SDEG = np.load('ExampleJob_interface_SDEG.npy', mmap_mode='r')
+			# Crack tip position of a crack growing in the negative x-direction
+			CrackTip = Interface['Failed'][:,0]
+
+    .. admonition:: Metadata
+
+        .. tabbed:: Environment
+
+            :badge:`Abaqus/CAE,badge-primary`
+
+        .. tabbed:: Version
+
+            v1.2.0
+
+        .. tabbed:: Date
+
+            2026-10-19
+
+    """
+    import numpy as np
+
+    Name = dict['JobID'].encode('ascii','ignore')
+    damageLimit = dict.get('damageLimit', 0.99)
+    Database = openOdb(Name+'.odb', readOnly=True)
+    instance = Database.rootAssembly.instances['PART-1-1']
+    region = instance.elementSets[dict.get('interfaceSet', 'Cz').upper()]
+    ## Element labels and centroids
+    Coordinates = {}
+    for node in instance.nodes:
+        Coordinates[node.label] = node.coordinates
+    Elements = np.array([element.label for element in region.elements])
+    order = np.argsort(Elements)
+    Elements = Elements[order]
+    Centroids = np.array([np.mean([Coordinates[label] for label in element.connectivity], axis=0) for element in region.elements])[order]
+    ## Number of frames of all steps, the frames are read one at a time in the loop below
+    nFrames = sum([len(step.frames) for step in Database.steps.values()])
+    if nFrames == 0:
+        print('There are no frames in ' + Name + '.odb')
+        Database.close()
+        return
+    lastFrame = [step for step in Database.steps.values() if len(step.frames) != 0][-1].frames[-1]
+    Time = np.zeros(nFrames)
+    Arrays = {}
+    Labels = ()
+    for variable in ['SDEG', 'STATUS', 'S']:
+        if variable not in lastFrame.fieldOutputs.keys():
+            print(variable + ' is not in the field output of ' + Name + '.odb')
+            continue
+        shape = (nFrames, len(Elements))
+        if variable == 'S':
+            # Components of the cohesive elements, the field of the whole model also has the components of the adherends
+            Labels = lastFrame.fieldOutputs['S'].getSubset(region=region, position=CENTROID).bulkDataBlocks[0].componentLabels
+            shape = shape + (len(Labels),)
+        Arrays[variable] = np.lib.format.open_memmap(Name+'_interface_'+variable+'.npy', mode='w+', dtype=np.float32, shape=shape)
+    lastFrame = None
+    Failed = np.nan*np.zeros((nFrames, 2))
+    ProcessZone = np.nan*np.zeros((nFrames, 2))
+    i = 0
+    for step in Database.steps.values():
+        for frame in step.frames:
+            Time[i] = step.totalTime+frame.frameValue
+            for variable in Arrays.keys():
+                if variable not in frame.fieldOutputs.keys():
+                    continue
+                field = frame.fieldOutputs[variable].getSubset(region=region, position=CENTROID)
+                for block in field.bulkDataBlocks:
+                    rows = np.searchsorted(Elements, np.array(block.elementLabels))
+                    data = np.array(block.data)
+                    Arrays[variable][i, rows] = data.reshape(Arrays[variable][i, rows].shape)
+            if 'SDEG' in Arrays:
+                x = Centroids[:,0]
+                damage = Arrays['SDEG'][i]
+                for Zone, elements in [(Failed, damage >= damageLimit), (ProcessZone, (damage > 0) & (damage < damageLimit))]:
+                    if elements.any():
+                        Zone[i] = [x[elements].min(), x[elements].max()]
+            i += 1
+    Database.close()
+    for variable in Arrays.keys():
+        Arrays[variable].flush()
+    np.savez(Name+'_interface.npz', Elements=Elements, Centroids=Centroids, Time=Time, Failed=Failed, ProcessZone=ProcessZone, SLabels=np.array(Labels, dtype=str))
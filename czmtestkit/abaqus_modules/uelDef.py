@@ -1,7 +1,13 @@
-def ReDefCE(Name, CzMat, CzIntMat):
+def ReDefCE(Name, CzMat, CzIntMat, nodeOrder=None, variables=21, CzField=None, buckets=16):
     """
 	**Redefine abaqus cohesive sections in the** ``.inp`` **file to user defined elements.**
 
+	The cohesive element blocks and sections are located with the keyword index of :class:`czmtestkit.py_modules.inpFile`.
+	The input file is then copied in a single pass to a temporary file, which replaces the ``.inp`` file when complete.
+	The user element is defined before the first cohesive element block, the element blocks are changed to the user element type and each cohesive section is replaced with the element properties for its element set.
+	With `CzField`, each cohesive section is replaced with the element sets ``<elset>_P1``, ``<elset>_P2``, ... of the property buckets, each with its own element properties.
+	The user element type, number of nodes, coordinates and active degrees of freedom of each cohesive element type (``COH3D8``, ``COH3D6`` and ``COH2D4``) are defined in ``czmtestkit.py_modules.UelConventions``.
+
 	:Parameters:
 	
 		**Name** (`str`): ``.inp`` file name.
@@ -10,6 +16,18 @@ def ReDefCE(Name, CzMat, CzIntMat):
 
 		**CzIntMat** (`list`): `int` list of element properties for the user elements.
 
+		**nodeOrder** (`dict`): Node order of the user elements (see :func:`czmtestkit.py_modules.reorderNodes`) with the cohesive element types as keys. The connectivity of these element blocks is reordered in bulk and rewritten [optional].
+
+		**variables** (`int`): Number of solution dependent variables of the user elements.
+
+		**CzField** (`function`, `str` or `list`): Spatially varying `float` element properties replacing `CzMat` [optional].
+
+			`function` or name of a function (``'module.function'``): called with the element centroids (one row per element) of each cohesive section and returns the properties with one row per element.
+
+			`list` or `numpy.ndarray`: properties with one row per element, in the order of the sorted element labels of the cohesive section.
+
+		**buckets** (`int`): Number of intervals per property to group the elements of `CzField` into element sets with common properties, see :func:`czmtestkit.py_modules.propertyBuckets`.
+
     .. dropdown:: Example
 
         Convert elements of ``type = COH3D8`` or ``type = COH3D6`` used with cohesive sections in Abaqus/CAE input file ``fileName.inp``:
@@ -45,16 +63,13 @@ def ReDefCE(Name, CzMat, CzIntMat):
                     +#  *USER ELEMENT, NODES=8, Type= U1, PROPERTIES=3, COORDINATES=3,
                     +#   UNSYMM, VARIABLES=21
                     +#   1, 2, 3
-                    +#  *UEL PROPERTY, elset=Cz
-                    +#   1.000, 31.003, 6.7894
-                    +#  *ELEMENT, TYPE=U1, elset=Cz
+                    +#  *ELEMENT, TYPE=U1
                     ...
-                    -#  ** Section: Section-2
+                    ** Section: Section-2
                     -#  *Cohesive Section, elset=Cz, material=Material-2, response=TRACTION SEPARATION
                     -#  , 
-                    +#  **** Section: Section-2
-                    +#  ***Cohesive Section, elset=Cz, material=Material-2, response=TRACTION SEPARATION
-                    +#  **, 
+                    +#  *UEL PROPERTY, elset=Cz
+                    +#   1.000,31.003,6.7894
                     ...
 
         where 3 in ``PROPERTIES=3`` is the length of `CzMat` list, or user defined elements with float and int variables as element properties:
@@ -74,17 +89,14 @@ def ReDefCE(Name, CzMat, CzIntMat):
                     +#  *USER ELEMENT, NODES=8, Type= U1, PROPERTIES=3, COORDINATES=3,
                     +#   UNSYMM, I PROPERTIES=2, VARIABLES=21
                     +#   1, 2, 3
-                    +#  *UEL PROPERTY, elset=Cz
-                    +#   1.000, 31.003, 6.7894,
-                    +#   1, 2
-                    +#  *ELEMENT, TYPE=U1, elset=Cz
+                    +#  *ELEMENT, TYPE=U1
                     ...
-                    -#  ** Section: Section-2
+                    ** Section: Section-2
                     -#  *Cohesive Section, elset=Cz, material=Material-2, response=TRACTION SEPARATION
                     -#  , 
-                    +#  **** Section: Section-2
-                    +#  ***Cohesive Section, elset=Cz, material=Material-2, response=TRACTION SEPARATION
-                    +#  **, 
+                    +#  *UEL PROPERTY, elset=Cz
+                    +#   1.000,31.003,6.7894,
+                    +#   1,2
                     ...
 
         where 3 in ``PROPERTIES=3`` is the length of `CzMat` list and 2 in ``I PROPERTIES=2`` is the length of `CzIntMat` list
@@ -97,7 +109,11 @@ def ReDefCE(Name, CzMat, CzIntMat):
 
         .. tabbed:: Version
             
-            v1.0.0
+            ==========  =====
+            **v1.2.0**  Single pass rewrite with constant memory using :class:`czmtestkit.py_modules.inpFile`. Added 6-node and 2D cohesive elements, ``nodeOrder``, ``variables``, ``CzField`` and ``buckets``.
+
+            v1.0.0      Initial release.
+            ==========  =====
 
         .. tabbed:: Date
             
@@ -112,67 +128,109 @@ def ReDefCE(Name, CzMat, CzIntMat):
                 Email: nanditha.mudunuru@gmail.com
 
     """
-    import numpy as np
+    import os
+    from ..py_modules import readInpFile, elementBlock, meshCache
     CzMat = [str(x) for x in CzMat]
-    MaterialProp = ','.join(CzMat)
-    ## Redefining cohesive elements
-    # Reading input file
-    file = open(Name+'.inp')
-    Input = file.read()
-    file.close()
-    # Spliting data lines
-    Input = Input.split('\n')
-    # Looking for key words
-    Key = [idx for idx in range(len(Input)-1) if '*' in Input[idx]]
-    # Looking for cohesive element defintions within the keyword lines
-    CohElem = [idx for idx in Key if 'Element,' in Input[idx] and 'type=COH' in Input[idx]]
-    # Looking for cohesive section defintion
-    CohSec = [idx for idx in Key if 'Cohesive Section,' in Input[idx]]
-    # Looking for parts
-    Parts = [idx for idx in Key if '*Part, name=' in Input[idx]]
-    # Finding section properties
-    SecElset = []
-    SecPart = []
-    for sec in CohSec:
-        strng = Input[sec].split(',')
-        SecElset.extend([substr for substr in strng if 'elset=' in substr])
-        ## Commenting the current section definition
-        Input[sec-1] = '**'
-        Input[sec] = '**'
-        Input[sec+1] = '**'
-        ## Finding the part to which the section is assigned to
-        PartIndex = np.array([idx for idx in Parts if idx < sec]).max()
-        SecPart.extend([Input[PartIndex].replace('*Part, name=', '')])
-    # Redefining elements as user elements
-    Output = []
-    TopStart = 0
-    for i in range(len(CohElem)):
-        CEBstart = CohElem[i]
-        CEelset = SecElset[i]
-        Top = Input[TopStart:CEBstart]
-        TopStart = CEBstart+1
-        Output.extend(Top)
-        Head = ['*USER ELEMENT, NODES=8, Type= U1, PROPERTIES='+str(len(CzMat))+', COORDINATES=3,']
-        if len(CzIntMat) != 0:
-            Head.extend([' UNSYMM, I PROPERTIES='+str(len(CzIntMat))+', VARIABLES=21'])
-        else:
-            Head.extend([' UNSYMM, VARIABLES=21'])
-        Head.extend([' 1, 2, 3'])
-        Head.extend(['*UEL PROPERTY, '+CEelset])
-        Head.extend([' '+MaterialProp])
-        if len(CzIntMat) != 0:
-            Head[-1] = Head[-1]+','
-            CzMatInt = [str(x) for x in CzIntMat]
-            CzIntMat = ','.join(CzMatInt)
-            Head.extend([' '+CzIntMat])
-        Head.extend(['*ELEMENT, TYPE=U1,'+CEelset])
-        Output.extend(Head)
-    Output.extend(Input[TopStart:])
-    
-    ## Writing the output
-    Input = Output
-    Output = [line for line in Input if '**' not in line]
-    Output = '\n'.join(Output)
-    file = open(Name+'.inp',"w")
-    file.write(Output)
-    file.close
\ No newline at end of file
+    CzIntMat = [str(x) for x in CzIntMat]
+    if nodeOrder is None:
+        nodeOrder = {}
+    Property = [' '+','.join(CzMat)]
+    if len(CzIntMat) != 0:
+        Property[-1] = Property[-1]+','
+        Property.append(' '+','.join(CzIntMat))
+    ## Finding cohesive elements and sections in the keyword index
+    inpFile = Name+'.inp'
+    tmpFile = Name+'.inp.tmp'
+    inp = readInpFile.inpFile(inpFile)
+    if CzField is not None:
+        mesh = meshCache.inpMesh(inpFile, cache=False)
+    Edits = []
+    userElements = []
+    for block in inp.keywords:
+        if block.name == 'element' and block.parameters.get('type', '').upper().startswith('COH'):
+            elemType = block.parameters['type'].upper()
+            if elemType not in elementBlock.UelConventions:
+                raise ValueError('No user element convention for element type '+elemType)
+            uel = elementBlock.UelConventions[elemType]
+            line = '*ELEMENT, TYPE='+uel['type']
+            if 'elset' in block.parameters:
+                line = line+', elset='+block.parameters['elset']
+            # User element is defined once, before its first element block
+            if elemType not in userElements:
+                Head = ['*USER ELEMENT, NODES='+str(uel['nodes'])+', Type= '+uel['type']+', PROPERTIES='+str(len(CzMat))+', COORDINATES='+str(uel['coordinates'])+',']
+                if len(CzIntMat) != 0:
+                    Head.append(' UNSYMM, I PROPERTIES='+str(len(CzIntMat))+', VARIABLES='+str(variables))
+                else:
+                    Head.append(' UNSYMM, VARIABLES='+str(variables))
+                Head.append(' '+uel['dofs'])
+                line = '\n'.join(Head+[line])
+                userElements.append(elemType)
+            if elemType in nodeOrder:
+                # Connectivity is rewritten from the reordered array
+                elements = elementBlock.reorderNodes(block.array(int), nodeOrder[elemType])
+                Edits.append((block.start, block.stop, '', [(elementBlock.writeElementBlock, elements, line)]))
+            else:
+                Edits.append((block.start, block.dataStart, line+'\n', []))
+        elif block.name == 'cohesive section' and CzField is not None:
+            # Element sets and properties of the buckets replace the section
+            elset = block.parameters['elset']
+            labels, values = _fieldValues(mesh[block.part or block.instance or 'Assembly'], elset, CzField)
+            if values.shape != (len(labels), len(CzMat)):
+                raise ValueError('CzField of elset '+elset+' has shape '+str(values.shape)+' instead of '+str((len(labels), len(CzMat))))
+            index, properties = elementBlock.propertyBuckets(values, buckets)
+            Sets = []
+            line = []
+            for i in range(len(properties)):
+                name = elset+'_P'+str(i+1)
+                Sets.append((elementBlock.writeSetBlock, labels[index == i], '*Elset, elset='+name))
+                line.append('*UEL PROPERTY, elset='+name)
+                line.append(' '+','.join([repr(float(x)) for x in properties[i]]))
+                if len(CzIntMat) != 0:
+                    line[-1] = line[-1]+','
+                    line.append(' '+','.join(CzIntMat))
+            Edits.append((block.start, block.stop, '\n'.join(line)+'\n', Sets))
+        elif block.name == 'cohesive section':
+            # Properties replace the section and its data lines
+            line = '\n'.join(['*UEL PROPERTY, elset='+block.parameters['elset']]+Property)
+            Edits.append((block.start, block.stop, line+'\n', []))
+    ## Copying the unchanged byte ranges between the edits
+    with open(inpFile, 'rb') as Input:
+        with open(tmpFile, 'wb') as Output:
+            position = 0
+            for start, stop, text, blocks in Edits+[(inp.size, inp.size, '', [])]:
+                Input.seek(position)
+                remaining = start-position
+                while remaining > 0:
+                    chunk = Input.read(min(remaining, 1048576))
+                    Output.write(chunk)
+                    remaining -= len(chunk)
+                for function, array, header in blocks:
+                    function(Output, array, header)
+                Output.write(text.encode('latin-1'))
+                position = stop
+    if os.path.exists(inpFile) and os.name == 'nt':
+        os.remove(inpFile)
+    os.rename(tmpFile, inpFile)
+
+def _fieldValues(mesh, elset, CzField):
+    """
+    Sorted element labels of `elset` and their properties from `CzField` (see :func:`ReDefCE`) using the mesh dictionary of the part/instance (see :func:`czmtestkit.py_modules.inpMesh`).
+    """
+    import numpy as np
+    labels = np.sort(mesh['Elsets'][elset])
+    if hasattr(CzField, 'rsplit'):
+        import importlib
+        module, function = CzField.rsplit('.', 1)
+        CzField = getattr(importlib.import_module(module), function)
+    if not callable(CzField):
+        return labels, np.asarray(CzField, dtype=float)
+    # Element centroids from the node coordinates
+    order = np.argsort(mesh['Nodes'])
+    centroids = np.zeros((len(labels), mesh['Coordinates'].shape[1]))
+    for elements in mesh['Elements'].values():
+        rows = np.isin(elements[:,0], labels)
+        if not rows.any():
+            continue
+        nodes = order[np.searchsorted(mesh['Nodes'], elements[rows,1:], sorter=order)]
+        centroids[np.searchsorted(labels, elements[rows,0])] = mesh['Coordinates'][nodes].mean(axis=1)
+    return labels, np.asarray(CzField(centroids), dtype=float)
@@ -2,8 +2,17 @@ from .simData import *
 from .analyticalMixedMode import *
 from .run_abq import *
 from .readMsgFile import *
-
-def run_sim(name, doe_data, fixed_data, abaqus_simFunc=None, abaqus_postProc=None, postProc=None):
+from .readDatFile import *
+from .benchmark import *
+from .restartFile import *
+from .czParameters import *
+from .readStaFile import *
+from .readInpFile import *
+from .meshCache import *
+from .elementBlock import *
+from .readFilFile import *
+
+def run_sim(name, doe_data, fixed_data, abaqus_simFunc=None, abaqus_postProc=None, postProc=None, solver=False, nJobs=1, datacheck=False, envProfile=None, usubCache=None, odbBatch=False):
     """
     **Sequentially run Abaqus/CAE simulations and/or post processing functions for a design of experiments.**
 
@@ -25,12 +34,27 @@ def run_sim(name, doe_data, fixed_data, abaqus_simFunc=None, abaqus_postProc=Non
 
             :'Constant_Key_2': Value of the variable named `Constant_Key_2`.
 
+            .. Note:: If ``'StiffnessCz'`` is ``'auto'`` (in `fixed_data` or `doe_data`), the penalty stiffness is computed for each test with :func:`penaltyStiffness` using ``'StiffnessAlpha'`` [optional, default 50] as :math:`\\alpha`, printed and saved to the test dictionary.
+
         **abaqus_simFunc** (`str`): Name of abaqus-python function from :mod:`czmtestkit.abaqus_modules`. See ``Example`` for the differnce between ``abaqus_simFunc`` and ``abaqus_postProc`` parameters and :mod:`czmtestkit.abaqus_modules` for available functions and instructions to create your own abaqus-python function that is compatible with the ``czmtestkit``.
 
         **abaqus_postProc** (`str`): Name of abaqus-python function from :mod:`czmtestkit.abaqus_modules`. See ``Example`` for the differnce between ``abaqus_simFunc`` and ``abaqus_postProc`` parameters and :mod:`czmtestkit.abaqus_modules` for available functions and instructions to create your own abaqus-python function that is compatible with the ``czmtestkit``.
 
         **postProc** (`function object`): Executable python post processing function.
 
+        **solver** (`bool`): ``True``: ``abaqus_simFunc`` is executed with ``'submit': False`` so Abaqus/CAE only writes the input file and releases the licence, and the analysis is run as a separate solver process with :func:`abqJob`.
+        The input file of the next test is generated while the previous analyses run. Post processing functions are executed once all the analyses are completed, analyses that failed are skipped.
+
+        **nJobs** (`int`): Maximum number of concurrent analyses if ``solver`` is ``True`` (or ``abaqus python`` processes if ``odbBatch`` is ``True``). A ``ValueError`` is raised for other values than 1 otherwise.
+
+        **envProfile** (`dict`): Tuning profile written to ``abaqus_v6.env`` in each test directory with :func:`abqEnv` if ``solver`` is ``True``. ``envProfile['cpus']`` replaces ``'nCpu'`` of the tests. The profile is saved as ``'envProfile'`` in the test dictionary. See :func:`envBenchmark` to compare profiles.
+
+        **usubCache** (`str`): Cache directory for compiled user subroutines. If ``solver`` is ``True``, the subroutine ``userSub['path']`` of tests with ``userSub['type'] == 'UEL'`` is compiled once with :func:`abqLibrary` and the analyses link against the library through ``usub_lib_dir`` in ``abaqus_v6.env``. The library directory is saved as ``'usubLibDir'`` in the test dictionary. The library is compiled again if the subroutine, the Abaqus release (:func:`abqRelease`) or the ``compile_*`` and ``link_*`` settings in ``envProfile['extra']`` change. A ``ValueError`` is raised if ``solver`` is not ``True``.
+
+        **odbBatch** (`bool`): ``True``: ``abaqus_postProc`` is executed for all tests after the simulations with :func:`abqPython` in `nJobs` ``abaqus python`` processes instead of one Abaqus/CAE session per test. Only for functions that do not need Abaqus/CAE, e.g. :func:`czmtestkit.abaqus_modules.historyOutput`.
+
+        **datacheck** (`bool`): ``True``: if ``solver`` is ``True``, the datacheck of each input file is run as job ``<JobID>_datacheck`` before the analysis. Tests with errors in ``<JobID>_datacheck.dat`` (see :func:`datMessages`) are not submitted for the analysis and the errors are printed. A ``ValueError`` is raised if ``solver`` is not ``True``.
+
 
     .. dropdown:: Example
 
@@ -196,7 +220,9 @@ def run_sim(name, doe_data, fixed_data, abaqus_simFunc=None, abaqus_postProc=Non
         .. tabbed:: Version
             
             ==========  =====
-            **v1.1.0**  Updated type and functionality of doe_data['npoints'].
+            **v1.2.0**  Added ``solver``, ``nJobs``, ``datacheck``, ``envProfile``, ``usubCache`` and ``odbBatch`` parameters.
+
+            v1.1.0      Updated type and functionality of doe_data['npoints'].
 
                         v1.0.0:  (`Int`) Number of points in the design on experiments.
             
@@ -218,75 +244,214 @@ def run_sim(name, doe_data, fixed_data, abaqus_simFunc=None, abaqus_postProc=Non
     """
     import os
     import json
+    import time
+    if solver is not True:
+        if nJobs != 1 and odbBatch is not True:
+            raise ValueError('nJobs is only used with solver=True or odbBatch=True')
+        if datacheck is True:
+            raise ValueError('datacheck is only used with solver=True')
+        if usubCache is not None:
+            raise ValueError('usubCache is only used with solver=True')
     try:
         os.mkdir(name)
     except:
         pass
     mainWd = os.getcwd()
     points = doe_data['nPoints']
-    data = {}
+    usubSettings = ''
+    if solver is True and usubCache is not None:
+        # Abaqus release and compiler settings of the environment file, a new library is compiled if they change
+        Flags = [(key, value) for key, value in (envProfile or {}).get('extra', {}).items() if key.startswith('compile_') or key.startswith('link_')]
+        usubSettings = abqRelease()+'\n'+repr(sorted(Flags))
+    queue = []
+    running = []
+    failed = []
     for i in points:
         os.chdir(mainWd)
-        point = 'point_{0:02d}'.format(i)
-        path = os.path.join(name,point)
-        try:
-            os.mkdir(path)
-        except:
-            pass
-        for key, value in fixed_data.items():
-            data[key] = value
-        for key,value in doe_data.items():
-            if key!='nPoints':
-                data[key] = value[i][0]
-        filePath = os.path.join(path,point+'.json')
+        point, path, filePath, data = _pointData(name, i, doe_data, fixed_data, setup=True)
         if abaqus_simFunc!=None:
+            if solver is True:
+                data['submit'] = False # Abaqus/CAE only writes the input file
+                # Solver settings recorded with the inputs of the test, reused by continue_sim
+                if envProfile is not None:
+                    data['envProfile'] = envProfile
+                    if 'cpus' in envProfile:
+                        data['nCpu'] = envProfile['cpus']
+                if usubCache is not None and data.get('userSub', {}).get('type') == 'UEL':
+                    data['usubLibDir'] = abqLibrary(data['userSub']['path'], usubCache, usubSettings)
             # Writting merged data
             with open(filePath, 'a') as file:
                 json.dump(data, file)
                 file.write("\n")
             abqFun(point+'.json', abaqus_simFunc, path) # Executing abaqus function
-        if abaqus_postProc!=None:
-            try:
-                #Reading existing data
-                file = open(filePath, 'r')
-                existingData = json.loads(file.readline())
-                file.close()
-                open(filePath, 'w').close() #clearing existing data
-                # Appending old data to new data
-                for key,value in existingData.items():
-                    data[key] = value
-            except:
-                pass
-            # Writting merged data to the file
-            with open(filePath, 'a') as file:
-                json.dump(data, file)
-                file.write("\n")
+            if solver is True:
+                profile, user = _solverProfile(data)
+                if profile is not None:
+                    abqEnv(path, profile)
+                if datacheck is True:
+                    queue.append((point, path, data, 'datacheck', user))
+                else:
+                    queue.append((point, path, data, 'analysis', user))
+                _runJobs(queue, running, failed, nJobs)
+        if solver is not True and odbBatch is not True:
+            _postProcessPoint(name, point, path, filePath, data, abaqus_postProc, postProc)
+    if solver is True or odbBatch is True:
+        while len(queue) != 0 or len(running) != 0:
+            _runJobs(queue, running, failed, nJobs)
+            time.sleep(1)
+        batch = None
+        if odbBatch is True:
+            batch = []
+        for i in points:
+            os.chdir(mainWd)
+            point, path, filePath, data = _pointData(name, i, doe_data, fixed_data)
+            if point in failed:
+                print('Skipping post processing of ' + point)
+                continue
+            if odbBatch is True:
+                _postProcessPoint(name, point, path, filePath, data, abaqus_postProc, None, batch)
+            else:
+                _postProcessPoint(name, point, path, filePath, data, abaqus_postProc, postProc)
+        if odbBatch is True:
+            os.chdir(mainWd)
+            if len(batch) != 0:
+                abqPython(batch, abaqus_postProc, nJobs)
+            for i in points:
+                os.chdir(mainWd)
+                point, path, filePath, data = _pointData(name, i, doe_data, fixed_data)
+                if point not in failed:
+                    _postProcessPoint(name, point, path, filePath, data, None, postProc)
+
+def _pointData(name, i, doe_data, fixed_data, setup=False):
+    """
+    Create the directory and the merged input dictionary of the test `i` in the design of experiments.
+    The computed penalty stiffness is printed only if `setup` is ``True``, when the test is set up, and not again for post processing.
+    """
+    import os
+    point = 'point_{0:02d}'.format(i)
+    path = os.path.join(name,point)
+    try:
+        os.mkdir(path)
+    except:
+        pass
+    data = {}
+    for key, value in fixed_data.items():
+        data[key] = value
+    for key,value in doe_data.items():
+        if key!='nPoints':
+            data[key] = value[i][0]
+    if data.get('StiffnessCz') == 'auto':
+        # Penalty stiffness from the adherands/plies
+        data['StiffnessCz'] = penaltyStiffness(data, data.get('StiffnessAlpha', 50))
+        if setup is True:
+            print(point + ': StiffnessCz = ' + str(data['StiffnessCz']))
+    filePath = os.path.join(path,point+'.json')
+    return point, path, filePath, data
+
+def _solverProfile(data):
+    """
+    Environment profile and ``user`` argument of :func:`abqJob` for a test from the ``'envProfile'`` and ``'usubLibDir'`` recorded by :func:`run_sim`.
+    User elements are linked against the library in ``'usubLibDir'`` through ``usub_lib_dir`` if it was compiled with ``usubCache``, otherwise ``subRout.for`` is compiled with the analysis.
+    """
+    profile = data.get('envProfile')
+    user = None
+    if data.get('userSub', {}).get('type') == 'UEL':
+        if data.get('usubLibDir') is None:
+            user = 'subRout.for'
+        else:
+            # Linking against the compiled library instead of compiling for each test
+            profile = dict(profile or {})
+            profile['extra'] = dict(profile.get('extra', {}))
+            profile['extra']['usub_lib_dir'] = data['usubLibDir']
+    return profile, user
+
+def _runJobs(queue, running, failed, nJobs):
+    """
+    Collect the finished solver processes and launch the queued ones, with at most `nJobs` processes running.
+    Tests that pass the datacheck are queued for the analysis, tests with errors are appended to `failed`.
+    """
+    import os
+    for job in list(running):
+        point, path, data, kind, user, process = job
+        if process.poll() is None:
+            continue
+        running.remove(job)
+        if kind == 'datacheck':
+            errors = []
+            datFile = os.path.join(path, data['JobID']+'_datacheck.dat')
+            if os.path.exists(datFile):
+                errors, warnings = datMessages(datFile)
+                print(point + ': datacheck completed with ' + str(len(errors)) + ' errors and ' + str(len(warnings)) + ' warnings')
+            if process.returncode != 0 or len(errors) != 0:
+                for error in errors:
+                    print(point + ': ' + error)
+                print('Datacheck of ' + point + ' failed, the analysis is not submitted')
+                failed.append(point)
+            else:
+                queue.append((point, path, data, 'analysis', user))
+        elif process.returncode != 0:
+            print('Analysis of ' + point + ' failed with exit status ' + str(process.returncode))
+            failed.append(point)
+    while len(queue) != 0 and len(running) < nJobs:
+        point, path, data, kind, user = queue.pop(0)
+        if kind == 'datacheck':
+            process = abqJob(data['JobID']+'_datacheck', path, inputFile=data['JobID'], user=user, nCpu=data.get('nCpu', 1), wait=False, datacheck=True)
+        else:
+            process = abqJob(data['JobID'], path, user=user, nCpu=data.get('nCpu', 1), wait=False)
+        running.append((point, path, data, kind, user, process))
+
+def _postProcessPoint(name, point, path, filePath, data, abaqus_postProc, postProc, batch=None):
+    """
+    Execute the abaqus-python and python post processing functions of a test.
+    If `batch` is a list, the abaqus-python function is not executed and the work directory and input file of the test are appended to `batch` for :func:`abqPython`.
+    """
+    import os
+    import json
+    mainWd = os.getcwd()
+    if abaqus_postProc!=None:
+        try:
+            #Reading existing data
+            file = open(filePath, 'r')
+            existingData = json.loads(file.readline())
+            file.close()
+            open(filePath, 'w').close() #clearing existing data
+            # Appending old data to new data
+            for key,value in existingData.items():
+                data[key] = value
+        except:
+            pass
+        # Writting merged data to the file
+        with open(filePath, 'a') as file:
+            json.dump(data, file)
+            file.write("\n")
+        if batch is not None:
+            batch.append((path, point+'.json'))
+        else:
             abqFun(point+'.json', abaqus_postProc, path) # Executing abaqus post processing function
-        if postProc!=None:
-            try:
-                #Reading existing data
-                file = open(filePath, 'r')
-                existingData = json.loads(file.readline())
-                file.close()
-                open(filePath, 'w').close() #clearing existing data
-                # Appending old data to new data
-                for key,value in existingData.items():
-                    data[key] = value
-            except:
-                pass
-            os.chdir(path)
-            output = postProc(data) # Executing post processing function
-            for key,value in output.items():
+    if postProc!=None:
+        try:
+            #Reading existing data
+            file = open(filePath, 'r')
+            existingData = json.loads(file.readline())
+            file.close()
+            open(filePath, 'w').close() #clearing existing data
+            # Appending old data to new data
+            for key,value in existingData.items():
                 data[key] = value
-            os.chdir(mainWd)
-            # Writting merged data back to the file
-            with open(filePath, 'a') as file:
-                json.dump(data, file)
-                file.write("\n")
-            with open(os.path.join(name,'Database.json'), 'a') as file:
-                json.dump(data, file)
-                file.write("\n")
-        data.clear()
+        except:
+            pass
+        os.chdir(path)
+        output = postProc(data) # Executing post processing function
+        for key,value in output.items():
+            data[key] = value
+        os.chdir(mainWd)
+        # Writting merged data back to the file
+        with open(filePath, 'a') as file:
+            json.dump(data, file)
+            file.write("\n")
+        with open(os.path.join(name,'Database.json'), 'a') as file:
+            json.dump(data, file)
+            file.write("\n")
 
 def run_analysis(JobID, analysis_func, setup_func=None):
     """
@@ -405,3 +570,106 @@ def run_analysis(JobID, analysis_func, setup_func=None):
         dict.clear()
     file.close() 
 
+
+def continue_sim(name, nPoints, Displacement, abaqus_postProc="czmtestkit.abaqus_modules.historyOutput"):
+    """
+    **Continue finished tests of a design of experiments to a new applied displacement from the restart data of the last increment.**
+
+    The tests have to be created by :func:`run_sim` with ``'restart': True`` (see :func:`czmtestkit.abaqus_modules.ADCB2`).
+    For each test, a restart input file ``<JobID>_ext<n>.inp`` is written with :func:`writeRestartInput`, executed with :func:`abqJob` and its history output is extracted with `abaqus_postProc` and appended to ``<JobID>.csv`` with :func:`appendHistory`.
+    Since the already converged increments are not repeated, only the extension of the load-displacement curve is computed.
+    ``'Displacement'`` in the test dictionary is updated to the new value, so :func:`Results` and the analysis functions use the extended history output.
+    The continuations run with the ``'envProfile'`` and the user subroutine library ``'usubLibDir'`` recorded by :func:`run_sim`.
+    The displacement of the original analysis is stored as ``'initialDisplacement'``, since each restart input file copies the step of ``<JobID>.inp`` and scales its displacement to the new value.
+
+    :Parameters:
+
+        **name** (`str`): ID for colleciton of tests in the design of experiments.
+
+        **nPoints** (`list`): Indices of the tests to be continued.
+
+        **Displacement** (`float`): New magnitude of the displacement applied at the load edge.
+
+        **abaqus_postProc** (`str`): Name of abaqus-python function from :mod:`czmtestkit.abaqus_modules` that writes the history output to a ``.csv`` file.
+
+    .. dropdown:: Example
+
+        .. code-block:: python
+
+            FixDict['restart'] = True
+            run_sim('ExampleDOE', VarDict, FixDict, abaqus_simFunc="czmtestkit.abaqus_modules.ADCB2", abaqus_postProc="czmtestkit.abaqus_modules.historyOutput")
+            # R-curve plateau not reached with FixDict['Displacement'] = 20
+            continue_sim('ExampleDOE', VarDict['nPoints'], 30)
+
+        ::
+
+            $ <current working directory>
+            └── ExampleDOE
+                └── point_00
+                    ├── <JobID>.csv             <- extended history output
+                    ├── <JobID>_ext1.inp
+                    ├── <JobID>_ext1.odb
+                    ├── ...
+                    └── point_00.json           <- 'Displacement': 30
+
+    .. admonition:: Metadata
+
+        .. tabbed:: Environment
+
+            :badge:`Python,badge-primary`
+
+        .. tabbed:: Version
+
+            v1.2.0
+
+        .. tabbed:: Date
+
+            2026-10-19
+
+    """
+    import os
+    import json
+    from .restartFile import writeRestartInput, appendHistory
+    mainWd = os.getcwd()
+    for i in nPoints:
+        os.chdir(mainWd)
+        point = 'point_{0:02d}'.format(i)
+        path = os.path.join(name, point)
+        filePath = os.path.join(path, point+'.json')
+        with open(filePath, 'r') as file:
+            data = json.loads(file.readline())
+        JobID = data['JobID']
+        oldJob = data.get('restartJob', JobID)
+        step = data.get('restartStep', 1)
+        newJob = JobID+'_ext'+str(step)
+        # The step is copied from the original input file with the original displacement
+        initial = data.get('initialDisplacement', data['Displacement'])
+        scale = float(Displacement)/initial
+        os.chdir(path)
+        writeRestartInput(JobID, newJob, scale, step)
+        os.chdir(mainWd)
+        # Solver settings of the original analysis
+        profile, user = _solverProfile(data)
+        if profile is not None:
+            abqEnv(path, profile)
+        returncode = abqJob(newJob, path, oldjob=oldJob, user=user, nCpu=data.get('nCpu', 1))
+        if returncode != 0:
+            print('Continuation of ' + point + ' failed, see ' + os.path.join(path, newJob+'.msg'))
+            continue
+        # Extracting the history output of the continuation
+        newData = dict(data)
+        newData['JobID'] = newJob
+        with open(os.path.join(path, newJob+'.json'), 'w') as file:
+            json.dump(newData, file)
+            file.write("\n")
+        abqFun(newJob+'.json', abaqus_postProc, path)
+        os.chdir(path)
+        appendHistory(JobID, newJob)
+        os.chdir(mainWd)
+        data['initialDisplacement'] = initial
+        data['Displacement'] = Displacement
+        data['restartJob'] = newJob
+        data['restartStep'] = step+1
+        with open(filePath, 'w') as file:
+            json.dump(data, file)
+            file.write("\n")
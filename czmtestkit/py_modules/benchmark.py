@@ -0,0 +1,279 @@
+def _runCases(name, cases, fixed_data, abaqus_simFunc, envProfile=None):
+    """
+    Run one test per entry of `cases` (dictionaries overriding `fixed_data`) with :func:`run_sim` and collect peak load, dissipated energy and wallclock time.
+    """
+    import os
+    import numpy as np
+    from . import run_sim
+    from .simData import Results
+    from .readDatFile import wallclockTime
+    keys = []
+    for case in cases:
+        for key in case.keys():
+            if key not in keys:
+                keys.append(key)
+    doe_data = {'nPoints': list(range(len(cases)))}
+    for key in keys:
+        doe_data[key] = [[case.get(key, fixed_data.get(key))] for case in cases]
+    fixed = {}
+    for key, value in fixed_data.items():
+        if key not in keys:
+            fixed[key] = value
+    fixed['submit'] = True
+    if envProfile is None:
+        run_sim(name, doe_data, fixed, abaqus_simFunc=abaqus_simFunc, abaqus_postProc='czmtestkit.abaqus_modules.historyOutput')
+    else:
+        if not os.path.exists(name):
+            os.makedirs(name)
+        run_sim(name, doe_data, fixed, abaqus_simFunc=abaqus_simFunc, abaqus_postProc='czmtestkit.abaqus_modules.historyOutput', solver=True, envProfile=envProfile)
+    mainWd = os.getcwd()
+    metrics = []
+    for i in doe_data['nPoints']:
+        path = os.path.join(name, 'point_{0:02d}'.format(i))
+        data = dict(fixed)
+        for key in keys:
+            data[key] = doe_data[key][i][0]
+        os.chdir(path)
+        try:
+            output = Results(data)
+            runtime = wallclockTime(data['JobID']+'.dat')
+        finally:
+            os.chdir(mainWd)
+        entry = dict(cases[i])
+        if output is None:
+            entry.update({'Peak Load': None, 'Energy': None, 'Runtime': runtime})
+        else:
+            force = np.array(output['Reaction Force'])
+            disp = np.array(output['Displacement'])
+            # numpy.trapz was renamed to numpy.trapezoid in NumPy 2.0
+            trapezoid = getattr(np, 'trapezoid', None) or np.trapz
+            entry.update({'Peak Load': float(force.max()), 'Energy': float(trapezoid(force, disp)), 'Runtime': runtime})
+        metrics.append(entry)
+    return metrics
+
+def _relativeErrors(metrics, reference):
+    """
+    Append relative errors of peak load and energy with respect to the `reference` entry of `metrics`.
+    """
+    for entry in metrics:
+        for key in ['Peak Load', 'Energy']:
+            if entry[key] is None or reference[key] in (None, 0):
+                entry[key+' Error'] = None
+            else:
+                entry[key+' Error'] = abs(entry[key]-reference[key])/abs(reference[key])
+    return metrics
+
+def _withinTolerance(entry, tolerance):
+    for key in ['Peak Load Error', 'Energy Error']:
+        if entry[key] is None or entry[key] > tolerance:
+            return False
+    return entry['Runtime'] is not None
+
+def _printTable(metrics, variable):
+    print('{0:>16s} {1:>12s} {2:>12s} {3:>12s} {4:>12s}'.format(variable, 'Peak Load', 'Energy', 'Runtime (s)', 'Max error'))
+    for entry in metrics:
+        errors = [entry[key] for key in ['Peak Load Error', 'Energy Error'] if entry[key] is not None]
+        print('{0:>16s} {1:>12s} {2:>12s} {3:>12s} {4:>12s}'.format(
+            str(entry[variable]), str(entry['Peak Load']), str(entry['Energy']), str(entry['Runtime']),
+            '{0:.2%}'.format(max(errors)) if len(errors) == 2 else 'n/a'))
+
+def profileBenchmark(name, data, profiles=('C3D8I', 'C3D8R', 'C3D20R'), abaqus_simFunc='czmtestkit.abaqus_modules.ADCB2', tolerance=0.02):
+    """
+    **Compare the accuracy and runtime of element profiles for the bulk adherands/plies.**
+
+    The test defined by `data` is run once for each element profile (see :func:`czmtestkit.abaqus_modules.bulkElemTypes`) using :func:`run_sim`.
+    The peak load and the energy (area under the load-displacement curve from :func:`Results`) are compared with the results of the first profile in `profiles`, which serves as the reference.
+    The runtime is the wallclock time read from the ``.dat`` file with :func:`wallclockTime`.
+
+    :Parameters:
+
+        **name** (`str`): ID for the collection of tests, see :func:`run_sim`.
+
+        **data** (`dict`): Input dictionary of the test function, e.g. the example ADCB case. ``'submit'`` is set to ``True``.
+
+        **profiles** (`tuple`): Element profiles to be compared. The first profile is the reference.
+
+        **abaqus_simFunc** (`str`): Name of the abaqus-python test function.
+
+        **tolerance** (`float`): Maximum relative error of peak load and energy with respect to the reference.
+
+    :return:
+
+        **Benchmark** (`dict`):
+
+            :'Profiles': (`list`) Dictionaries with ``'elementProfile'``, ``'Peak Load'``, ``'Energy'``, ``'Runtime'``, ``'Peak Load Error'`` and ``'Energy Error'`` of each profile.
+
+            :'Recommended': (`str`) Profile with the smallest runtime within `tolerance`.
+
+    .. dropdown:: Example
+
+        .. code-block:: python
+
+            Benchmark = profileBenchmark('ProfileBenchmark', ADCB_dict)
+            ADCB_dict['elementProfile'] = Benchmark['Recommended']
+
+    .. admonition:: Metadata
+
+        .. tabbed:: Environment
+
+            :badge:`Python,badge-primary`
+
+        .. tabbed:: Version
+
+            v1.2.0
+
+        .. tabbed:: Date
+
+            2026-10-19
+
+    """
+    cases = [{'elementProfile': profile} for profile in profiles]
+    metrics = _runCases(name, cases, data, abaqus_simFunc)
+    metrics = _relativeErrors(metrics, metrics[0])
+    _printTable(metrics, 'elementProfile')
+    valid = [entry for entry in metrics if _withinTolerance(entry, tolerance)]
+    recommended = profiles[0]
+    if len(valid) != 0:
+        recommended = min(valid, key=lambda entry: entry['Runtime'])['elementProfile']
+    print('Recommended element profile: ' + recommended)
+    return {'Profiles': metrics, 'Recommended': recommended}
+
+def viscosityCalibration(name, data, viscosities=(1e-5, 1e-4, 1e-3, 1e-2), meshFactor=2.0, abaqus_simFunc='czmtestkit.abaqus_modules.ADCB2', tolerance=0.02):
+    """
+    **Calibrate the viscous regularisation of the cohesive zone against the unregularised solution.**
+
+    The test defined by `data` is run on a coarse mesh (``'MeshCrack'``, ``'MeshX'`` and ``'MeshZ'`` multiplied by `meshFactor`) without viscous regularisation and with each value in `viscosities` (key ``'viscosity'``, see :func:`czmtestkit.abaqus_modules.ADCB2`).
+    The peak load and the energy of the regularised solutions are compared with the unregularised reference and the largest viscosity within `tolerance` is recommended.
+    Larger viscosities suppress the snap-through at crack initiation and reduce the number of iterations and cutbacks, at the expense of an artificial increase in the load.
+
+    :Parameters:
+
+        **name** (`str`): ID for the collection of tests, see :func:`run_sim`.
+
+        **data** (`dict`): Input dictionary of the test function. ``'submit'`` is set to ``True``.
+
+        **viscosities** (`tuple`): Ladder of viscosity coefficients.
+
+        **meshFactor** (`float`): Multiplier for the seed sizes of the calibration mesh.
+
+        **abaqus_simFunc** (`str`): Name of the abaqus-python test function.
+
+        **tolerance** (`float`): Maximum relative error of peak load and energy with respect to the unregularised solution.
+
+    :return:
+
+        **Calibration** (`dict`):
+
+            :'Viscosities': (`list`) Dictionaries with ``'viscosity'``, ``'Peak Load'``, ``'Energy'``, ``'Runtime'``, ``'Peak Load Error'`` and ``'Energy Error'`` of the reference and each viscosity.
+
+            :'Recommended': (`float`) Largest viscosity within `tolerance`. ``0.0`` if none of the values is within `tolerance` or the reference did not complete.
+
+    .. dropdown:: Example
+
+        .. code-block:: python
+
+            Calibration = viscosityCalibration('ViscosityCalibration', ADCB_dict)
+            FixDict['viscosity'] = Calibration['Recommended']
+            run_sim('ExampleDOE', VarDict, FixDict, abaqus_simFunc="czmtestkit.abaqus_modules.ADCB2")
+
+    .. admonition:: Metadata
+
+        .. tabbed:: Environment
+
+            :badge:`Python,badge-primary`
+
+        .. tabbed:: Version
+
+            v1.2.0
+
+        .. tabbed:: Date
+
+            2026-10-19
+
+    """
+    coarse = dict(data)
+    for key in ['MeshCrack', 'MeshX', 'MeshZ']:
+        if key in coarse:
+            coarse[key] = coarse[key]*meshFactor
+    cases = [{'viscosity': 0.0}] + [{'viscosity': viscosity} for viscosity in viscosities]
+    metrics = _runCases(name, cases, coarse, abaqus_simFunc)
+    metrics = _relativeErrors(metrics, metrics[0])
+    _printTable(metrics, 'viscosity')
+    valid = [entry['viscosity'] for entry in metrics[1:] if _withinTolerance(entry, tolerance)]
+    recommended = 0.0
+    if metrics[0]['Peak Load'] is None:
+        print('The unregularised reference did not complete, no viscosity is recommended')
+    elif len(valid) != 0:
+        recommended = max(valid)
+    print('Recommended viscosity: ' + str(recommended))
+    return {'Viscosities': metrics, 'Recommended': recommended}
+
+def envBenchmark(name, data, profiles, abaqus_simFunc='czmtestkit.abaqus_modules.ADCB2', tolerance=1e-3):
+    """
+    **Compare solver tuning profiles on a reference test.**
+
+    The test defined by `data` is run once for each tuning profile with ``run_sim(..., solver=True, envProfile=profile)``, which writes the profile to ``abaqus_v6.env`` with :func:`abqEnv`.
+    The wallclock times from the ``.dat`` files are compared and the fastest profile is recommended.
+    Since the profiles only change the parallelization and memory settings, the peak load and the energy are checked against the first profile with `tolerance` to detect failed or diverging runs.
+
+    :Parameters:
+
+        **name** (`str`): ID for the collection of tests. Each profile is run in the sub directory ``name/<profile name>``.
+
+        **data** (`dict`): Input dictionary of the reference test.
+
+        **profiles** (`dict`): Tuning profiles (see :func:`abqEnv`) with the profile names as keys.
+
+        **abaqus_simFunc** (`str`): Name of the abaqus-python test function.
+
+        **tolerance** (`float`): Maximum relative error of peak load and energy with respect to the first profile.
+
+    :return:
+
+        **Benchmark** (`dict`):
+
+            :'Profiles': (`list`) Dictionaries with ``'envProfile'``, ``'Peak Load'``, ``'Energy'``, ``'Runtime'``, ``'Peak Load Error'`` and ``'Energy Error'`` of each profile.
+
+            :'Recommended': (`str`) Name of the fastest profile within `tolerance`.
+
+    .. dropdown:: Example
+
+        .. code-block:: python
+
+            profiles = {
+                'threads_4': {'cpus': 4, 'mp_mode': 'threads', 'standard_parallel': 'all'},
+                'mpi_4': {'cpus': 4, 'mp_mode': 'mpi', 'standard_parallel': 'all'},
+                'threads_8_solver': {'cpus': 8, 'mp_mode': 'threads', 'standard_parallel': 'solver', 'memory': '80 %'},
+            }
+            Benchmark = envBenchmark('EnvBenchmark', ADCB_dict, profiles)
+            run_sim('ExampleDOE', VarDict, FixDict, abaqus_simFunc="czmtestkit.abaqus_modules.ADCB2", solver=True, envProfile=profiles[Benchmark['Recommended']])
+
+    .. admonition:: Metadata
+
+        .. tabbed:: Environment
+
+            :badge:`Python,badge-primary`
+
+        .. tabbed:: Version
+
+            v1.2.0
+
+        .. tabbed:: Date
+
+            2026-10-19
+
+    """
+    import os
+    metrics = []
+    for profileName in profiles.keys():
+        entry = _runCases(os.path.join(name, profileName), [{}], data, abaqus_simFunc, envProfile=profiles[profileName])[0]
+        entry['envProfile'] = profileName
+        metrics.append(entry)
+    metrics = _relativeErrors(metrics, metrics[0])
+    _printTable(metrics, 'envProfile')
+    valid = [entry for entry in metrics if _withinTolerance(entry, tolerance)]
+    recommended = metrics[0]['envProfile']
+    if len(valid) != 0:
+        recommended = min(valid, key=lambda entry: entry['Runtime'])['envProfile']
+    print('Recommended tuning profile: ' + recommended)
+    return {'Profiles': metrics, 'Recommended': recommended}
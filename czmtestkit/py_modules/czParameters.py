@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+def penaltyStiffness(data, alpha=50):
+    """
+
+    **Recommended penalty stiffness of the cohesive zone.**
+
+    The penalty stiffness is selected such that the compliance added by the cohesive zone is negligible compared to the through-thickness compliance of the adjacent adherands/plies `[1]`_:
+
+    .. math::
+
+        K = \\alpha \\frac{E_3}{t}
+
+    where :math:`E_3` is the through-thickness modulus and :math:`t` the thickness of an adherand/ply.
+    The larger of the values for the top and the bottom adherand/ply is returned, so the criterion holds for both.
+    Larger values of :math:`\\alpha` do not improve the compliance noticeably but increase the number of iterations and cutbacks.
+
+    :Parameters:
+
+        **data** (`dict`): Input dictionary of the test with the keys ``'tTop'``, ``'tBot'`` and ``'E'`` or ``'ETop'`` and ``'EBot'`` (engineering constants with E3 as the third entry).
+
+        **alpha** (`float`): Parameter :math:`\\alpha \\gg 1`.
+
+    :return:
+
+        **K** (`float`): Penalty stiffness.
+
+    .. dropdown:: Example
+
+        .. code-block:: python
+
+            data = {'tTop': 1.5, 'tBot': 5.1, 'ETop': [109000.0, 8819.0, 8819.0, ...], 'EBot': [109000.0, 8819.0, 8819.0, ...]}
+            print(penaltyStiffness(data))
+
+        **Output**
+
+        ::
+
+            293966.6666666667
+
+    **References:**
+
+    .. _[1]:
+
+        1) Turon, A., Dávila, C. G., Camanho, P. P., & Costa, J. (2007). An engineering solution for mesh size effects in the simulation of delamination using cohesive zone models. Engineering Fracture Mechanics, 74(10), 1665-1682.
+
+    .. admonition:: Metadata
+
+        .. tabbed:: Environment
+
+            :badge:`Python,badge-primary`
+
+        .. tabbed:: Version
+
+            v1.2.0
+
+        .. tabbed:: Date
+
+            2026-10-19
+
+    """
+    ETop = data.get('ETop', data.get('E'))
+    EBot = data.get('EBot', ETop)
+    tTop = data['tTop']
+    tBot = data.get('tBot', tTop)
+    return float(alpha)*max(ETop[2]/float(tTop), EBot[2]/float(tBot))
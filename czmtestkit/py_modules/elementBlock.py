@@ -0,0 +1,241 @@
+# User element definitions replacing the Abaqus cohesive element types
+UelConventions = {
+    'COH3D8': {'type': 'U1', 'nodes': 8, 'coordinates': 3, 'dofs': '1, 2, 3'},
+    'COH3D6': {'type': 'U2', 'nodes': 6, 'coordinates': 3, 'dofs': '1, 2, 3'},
+    'COH2D4': {'type': 'U3', 'nodes': 4, 'coordinates': 2, 'dofs': '1, 2'},
+}
+
+def reorderNodes(elements, order):
+    """
+
+    **Reorder the nodes of all elements of an element block.**
+
+    :Parameters:
+
+        **elements** (`numpy.ndarray`): Element block with the element label followed by the node labels in each row, e.g. from :meth:`inpKeyword.array`.
+
+        **order** (`list`): Zero based positions of the original nodes in the new connectivity, e.g. ``[1, 0, 2, 4, 3, 5]`` swaps the first two nodes of both faces of a 6-node wedge.
+
+    :return:
+
+        (`numpy.ndarray`) Element block with the reordered connectivity.
+
+    .. dropdown:: Example
+
+        .. code-block:: python
+
+            inp = inpFile('ExampleJob.inp')
+            elements = inp.find('element', type='COH3D8')[0].array(int)
+            # Top face first
+            elements = reorderNodes(elements, [4, 5, 6, 7, 0, 1, 2, 3])
+
+    .. admonition:: Metadata
+
+        .. tabbed:: Environment
+
+            :badge:`Python,badge-primary`
+
+        .. tabbed:: Version
+
+            v1.2.0
+
+        .. tabbed:: Date
+
+            2026-10-19
+
+    """
+    import numpy as np
+    order = np.asarray(order, dtype=int)
+    if sorted(order.tolist()) != list(range(elements.shape[1]-1)):
+        raise ValueError('order must be a permutation of the '+str(elements.shape[1]-1)+' nodes of the elements')
+    return elements[:, np.concatenate([[0], order+1])]
+
+def renumberElements(elements, start=1):
+    """
+
+    **Renumber the elements of an element block consecutively.**
+
+    :Parameters:
+
+        **elements** (`numpy.ndarray`): Element block with the element label followed by the node labels in each row.
+
+        **start** (`int`): New label of the first element.
+
+    :return:
+
+        **elements** (`numpy.ndarray`): Element block with the new labels.
+
+        **labels** (`numpy.ndarray`): Original labels of the elements, to map element sets and output to the new labels.
+
+    .. admonition:: Metadata
+
+        .. tabbed:: Environment
+
+            :badge:`Python,badge-primary`
+
+        .. tabbed:: Version
+
+            v1.2.0
+
+        .. tabbed:: Date
+
+            2026-10-19
+
+    """
+    import numpy as np
+    labels = elements[:,0].copy()
+    elements = elements.copy()
+    elements[:,0] = np.arange(start, start+len(elements))
+    return elements, labels
+
+def writeElementBlock(file, elements, header=None):
+    """
+
+    **Write an element block to an open** ``.inp`` **file.**
+
+    The rows are formatted with :func:`numpy.savetxt` in one call, with at most 16 entries per line as required by Abaqus.
+
+    :Parameters:
+
+        **file** (`file`): File opened for writing.
+
+        **elements** (`numpy.ndarray`): Element block with the element label followed by the node labels in each row.
+
+        **header** (`str`): Keyword line written before the data, e.g. ``'*ELEMENT, TYPE=U1'``.
+
+    .. dropdown:: Example
+
+        .. code-block:: python
+
+            with open('Elements.inp', 'w') as file:
+                writeElementBlock(file, elements, '*ELEMENT, TYPE=U2, elset=Cz')
+
+    .. admonition:: Metadata
+
+        .. tabbed:: Environment
+
+            :badge:`Python,badge-primary`
+
+        .. tabbed:: Version
+
+            v1.2.0
+
+        .. tabbed:: Date
+
+            2026-10-19
+
+    """
+    import numpy as np
+    if header is not None:
+        np.savetxt(file, [], header=header, comments='')
+    columns = elements.shape[1]
+    # Continuation lines after 16 entries
+    fmt = ',\n'.join([', '.join(['%d']*min(16, columns-i)) for i in range(0, columns, 16)])
+    np.savetxt(file, elements, fmt=fmt)
+
+def writeSetBlock(file, labels, header=None):
+    """
+
+    **Write a node or element set to an open** ``.inp`` **file.**
+
+    The labels are formatted with :func:`numpy.savetxt` with 16 labels per line.
+
+    :Parameters:
+
+        **file** (`file`): File opened for writing.
+
+        **labels** (`numpy.ndarray`): Node or element labels.
+
+        **header** (`str`): Keyword line written before the data, e.g. ``'*Elset, elset=Cz_P1'``.
+
+    .. admonition:: Metadata
+
+        .. tabbed:: Environment
+
+            :badge:`Python,badge-primary`
+
+        .. tabbed:: Version
+
+            v1.2.0
+
+        .. tabbed:: Date
+
+            2026-10-19
+
+    """
+    import numpy as np
+    labels = np.asarray(labels, dtype=int)
+    if header is not None:
+        np.savetxt(file, [], header=header, comments='')
+    full = (len(labels)//16)*16
+    if full != 0:
+        np.savetxt(file, labels[:full].reshape(-1, 16), fmt=', '.join(['%d']*16))
+    if full != len(labels):
+        np.savetxt(file, labels[full:].reshape(1, -1), fmt=', '.join(['%d']*(len(labels)-full)))
+
+def propertyBuckets(values, buckets=16):
+    """
+
+    **Group elements with spatially varying properties into buckets with a common property set.**
+
+    If the number of distinct rows of `values` does not exceed `buckets`, each distinct row is a bucket.
+    Otherwise each property is divided into `buckets` intervals of equal width between its minimum and maximum, elements in the same intervals for all properties form a bucket and the properties of the bucket are the mean of the properties of its elements.
+
+    :Parameters:
+
+        **values** (`numpy.ndarray`): Properties with one row per element.
+
+        **buckets** (`int`): Number of intervals per property.
+
+    :return:
+
+        **index** (`numpy.ndarray`): Bucket of each element.
+
+        **properties** (`numpy.ndarray`): Properties with one row per bucket.
+
+    .. dropdown:: Example
+
+        .. code-block:: python
+
+            index, properties = propertyBuckets(np.array([[1.0, 10.0], [1.0, 10.0], [2.0, 10.0]]))
+            print(index, properties)
+
+        **Output**
+
+        ::
+
+            [0 0 1] [[ 1. 10.]
+             [ 2. 10.]]
+
+    .. admonition:: Metadata
+
+        .. tabbed:: Environment
+
+            :badge:`Python,badge-primary`
+
+        .. tabbed:: Version
+
+            v1.2.0
+
+        .. tabbed:: Date
+
+            2026-10-19
+
+    """
+    import numpy as np
+    values = np.asarray(values, dtype=float)
+    if values.ndim == 1:
+        values = values.reshape(-1, 1)
+    properties, index = np.unique(values, axis=0, return_inverse=True)
+    if len(properties) > buckets:
+        low = values.min(axis=0)
+        width = (values.max(axis=0)-low)/buckets
+        width[width == 0] = 1.0
+        bins = np.minimum(((values-low)/width).astype(int), buckets-1)
+        keys, index = np.unique(bins, axis=0, return_inverse=True)
+        index = index.reshape(-1)
+        counts = np.bincount(index, minlength=len(keys)).astype(float)
+        properties = np.zeros((len(keys), values.shape[1]))
+        for j in range(values.shape[1]):
+            properties[:,j] = np.bincount(index, weights=values[:,j], minlength=len(keys))/counts
+    return index.reshape(-1), properties
@@ -0,0 +1,190 @@
+def inpMesh(fileName, cache=True):
+    """
+
+    **Nodes, elements and sets of an Abaqus** ``.inp`` **file as NumPy arrays, cached in binary format next to the file.**
+
+    On the first call the keyword blocks ``*Node``, ``*Element``, ``*Nset`` and ``*Elset`` are read with :class:`inpFile` and saved as ``.npy`` files in the directory ``<fileName without extension>_mesh`` with the index ``mesh.json``.
+    Later calls memory-map the ``.npy`` files instead of parsing the input file.
+    The cache is rebuilt if the size or the modification time of the input file changed and its SHA-1 hash differs from the hash in the index.
+
+    :Parameters:
+
+        **fileName** (`str`): path to the `.inp` file including the file name and extension.
+
+        **cache** (`bool`): ``False``: the arrays are read from the input file without writing or reading the cache.
+
+    :return:
+
+        **mesh** (`dict`): One dictionary for each scope of the input file, with the part name, the instance name or ``'Assembly'`` (model level keywords) as keys and the following items:
+
+            :'Nodes': (`numpy.ndarray`) Node labels.
+
+            :'Coordinates': (`numpy.ndarray`) Node coordinates, one row per node.
+
+            :'Elements': (`dict`) Connectivity with the element type as keys. Each row has the element label followed by the node labels.
+
+            :'Nsets': (`dict`) Node labels with the set names as keys.
+
+            :'Elsets': (`dict`) Element labels with the set names as keys.
+
+    .. dropdown:: Example
+
+        .. code-block:: python
+
+            mesh = inpMesh('ExampleJob.inp')
+            Cz = mesh['Cz']
+            Elements = Cz['Elements']['COH3D8']
+            # x-coordinates of the element centroids
+            x = Cz['Coordinates'][np.searchsorted(Cz['Nodes'], Elements[:,1:]), 0].mean(axis=1)
+
+    .. admonition:: Metadata
+
+        .. tabbed:: Environment
+
+            :badge:`Python,badge-primary`
+
+        .. tabbed:: Version
+
+            v1.2.0
+
+        .. tabbed:: Date
+
+            2026-10-19
+
+    """
+    import os
+    import json
+    import numpy as np
+    if cache is not True:
+        return _readMesh(fileName)
+    cacheDir = os.path.splitext(fileName)[0]+'_mesh'
+    indexFile = os.path.join(cacheDir, 'mesh.json')
+    stat = os.stat(fileName)
+    index = None
+    if os.path.exists(indexFile):
+        with open(indexFile, 'r') as file:
+            index = json.load(file)
+        if index['size'] != stat.st_size:
+            index = None
+        elif index['mtime'] != stat.st_mtime:
+            # Modified time changes without a change in content, e.g. after copying
+            if index['sha1'] == _sha1(fileName):
+                index['mtime'] = stat.st_mtime
+                with open(indexFile, 'w') as file:
+                    json.dump(index, file)
+            else:
+                index = None
+    if index is None:
+        mesh = _readMesh(fileName)
+        index = {'source': os.path.abspath(fileName), 'size': stat.st_size, 'mtime': stat.st_mtime, 'sha1': _sha1(fileName), 'arrays': []}
+        if not os.path.exists(cacheDir):
+            os.makedirs(cacheDir)
+        for scope, data in mesh.items():
+            for key in ['Nodes', 'Coordinates']:
+                index['arrays'].append(_saveArray(cacheDir, len(index['arrays']), [scope, key], data[key]))
+            for key in ['Elements', 'Nsets', 'Elsets']:
+                for name, array in data[key].items():
+                    index['arrays'].append(_saveArray(cacheDir, len(index['arrays']), [scope, key, name], array))
+        with open(indexFile, 'w') as file:
+            json.dump(index, file)
+        return mesh
+    mesh = {}
+    for entry in index['arrays']:
+        array = np.load(os.path.join(cacheDir, entry['file']), mmap_mode='r')
+        keys = entry['keys']
+        if keys[0] not in mesh:
+            mesh[keys[0]] = _emptyScope()
+        if len(keys) == 2:
+            mesh[keys[0]][keys[1]] = array
+        else:
+            mesh[keys[0]][keys[1]][keys[2]] = array
+    return mesh
+
+def _emptyScope():
+    import numpy as np
+    return {'Nodes': np.zeros(0, dtype=int), 'Coordinates': np.zeros((0, 3)), 'Elements': {}, 'Nsets': {}, 'Elsets': {}}
+
+def _saveArray(cacheDir, i, keys, array):
+    """
+    Save `array` to ``cacheDir`` and return the index entry with the file name and the `keys` of the array in the mesh dictionary.
+    """
+    import os
+    import numpy as np
+    name = 'array_{0:05d}.npy'.format(i)
+    np.save(os.path.join(cacheDir, name), array)
+    return {'file': name, 'keys': keys}
+
+def _sha1(fileName):
+    import hashlib
+    sha1 = hashlib.sha1()
+    with open(fileName, 'rb') as file:
+        chunk = file.read(1048576)
+        while len(chunk) != 0:
+            sha1.update(chunk)
+            chunk = file.read(1048576)
+    return sha1.hexdigest()
+
+def _setLabels(block, sets):
+    """
+    Labels of a ``*Nset`` or ``*Elset`` block, including ``generate`` ranges and references to the sets in `sets`.
+    """
+    import numpy as np
+    labels = []
+    if 'generate' in block.parameters:
+        for row in block.array(int):
+            step = row[2] if len(row) > 2 else 1
+            labels.append(np.arange(row[0], row[1]+1, step))
+    else:
+        for line in block.lines():
+            for entry in line.split(','):
+                entry = entry.strip()
+                if entry == '':
+                    continue
+                if entry.lstrip('-').isdigit():
+                    labels.append(np.array([int(entry)]))
+                elif entry in sets:
+                    labels.append(np.asarray(sets[entry]))
+    if len(labels) == 0:
+        return np.zeros(0, dtype=int)
+    return np.concatenate(labels).astype(int)
+
+def _readMesh(fileName):
+    """
+    Read the nodes, elements and sets of an input file into the mesh dictionary of :func:`inpMesh`.
+    """
+    import numpy as np
+    from .readInpFile import inpFile
+    inp = inpFile(fileName)
+    mesh = {}
+    for block in inp.keywords:
+        if block.name not in ['node', 'element', 'nset', 'elset']:
+            continue
+        scope = block.part or block.instance or 'Assembly'
+        if scope not in mesh:
+            mesh[scope] = _emptyScope()
+        data = mesh[scope]
+        if block.name == 'node':
+            array = block.array()
+            if len(array) == 0:
+                continue
+            if len(data['Nodes']) == 0:
+                data['Coordinates'] = np.zeros((0, array.shape[1]-1))
+            data['Nodes'] = np.concatenate([data['Nodes'], array[:,0].astype(int)])
+            data['Coordinates'] = np.concatenate([data['Coordinates'], array[:,1:]])
+            if 'nset' in block.parameters:
+                data['Nsets'][block.parameters['nset']] = array[:,0].astype(int)
+        elif block.name == 'element':
+            array = block.array(int)
+            if len(array) == 0:
+                continue
+            elemType = block.parameters['type'].upper()
+            if 'elset' in block.parameters:
+                data['Elsets'][block.parameters['elset']] = array[:,0]
+            if elemType in data['Elements']:
+                array = np.concatenate([data['Elements'][elemType], array])
+            data['Elements'][elemType] = array
+        elif block.name == 'nset':
+            data['Nsets'][block.parameters['nset']] = _setLabels(block, data['Nsets'])
+        else:
+            data['Elsets'][block.parameters['elset']] = _setLabels(block, data['Elsets'])
+    return mesh
@@ -0,0 +1,310 @@
+def wallclockTime(fileName):
+    """
+
+    **Read the wallclock time of an analysis from the Abaqus** ``.dat`` **file.**
+
+    Abaqus prints the job time summary at the end of the ``.dat`` file, once for the pre-processor and once for the analysis.
+    :func:`wallclockTime` returns the sum of the ``WALLCLOCK TIME (SEC)`` entries.
+
+    :Parameters:
+
+        **fileName** (`str`): path to the `.dat` file including the file name and extension.
+
+    :return:
+
+        **time** (`float`): Wallclock time in seconds. ``None`` if the file does not exist or the job time summary is missing (analysis not completed).
+
+    .. dropdown:: Example
+
+        If ``filename.dat`` file has the following content,
+
+        .. code:: none
+
+                                       JOB TIME SUMMARY
+                 USER TIME (SEC)      =   1.7000
+                 SYSTEM TIME (SEC)    =  0.10000
+                 TOTAL CPU TIME (SEC) =   1.8000
+                 WALLCLOCK TIME (SEC) =            2
+            ...
+                                       JOB TIME SUMMARY
+                 USER TIME (SEC)      =   104.80
+                 SYSTEM TIME (SEC)    =   1.3000
+                 TOTAL CPU TIME (SEC) =   106.10
+                 WALLCLOCK TIME (SEC) =          107
+
+        then
+
+        .. code-block:: python
+
+            print(wallclockTime("filename.dat"))
+
+        **Output**
+
+        ::
+
+            109.0
+
+    .. admonition:: Metadata
+
+        .. tabbed:: Environment
+
+            :badge:`Python,badge-primary`
+
+        .. tabbed:: Version
+
+            v1.2.0
+
+        .. tabbed:: Date
+
+            2026-10-19
+
+    """
+    import os
+    if not os.path.exists(fileName):
+        return None
+    time = None
+    with open(fileName, 'r') as file:
+        for line in file:
+            if 'WALLCLOCK TIME (SEC)' in line:
+                time = (time or 0.0) + float(line.split('=')[-1])
+    return time
+
+def datMessages(fileName):
+    """
+
+    **Read the error and warning messages from the Abaqus** ``.dat`` **file.**
+
+    Messages start with ``***ERROR`` or ``***WARNING`` and continue on the following indented lines.
+
+    :Parameters:
+
+        **fileName** (`str`): path to the `.dat` file including the file name and extension.
+
+    :return:
+
+        **errors** (`list`): Error messages.
+
+        **warnings** (`list`): Warning messages.
+
+    .. dropdown:: Example
+
+        If ``filename.dat`` file has the following content,
+
+        .. code:: none
+
+             ***ERROR: THE NUMBER OF PROPERTIES GIVEN ON THE *UEL PROPERTY OPTION
+                       DOES NOT MATCH THE NUMBER SPECIFIED ON THE *USER ELEMENT OPTION
+
+        then
+
+        .. code-block:: python
+
+            errors, warnings = datMessages("filename.dat")
+            print(errors)
+
+        **Output**
+
+        ::
+
+            ['***ERROR: THE NUMBER OF PROPERTIES GIVEN ON THE *UEL PROPERTY OPTION DOES NOT MATCH THE NUMBER SPECIFIED ON THE *USER ELEMENT OPTION']
+
+    .. admonition:: Metadata
+
+        .. tabbed:: Environment
+
+            :badge:`Python,badge-primary`
+
+        .. tabbed:: Version
+
+            v1.2.0
+
+        .. tabbed:: Date
+
+            2026-10-19
+
+    """
+    errors = []
+    warnings = []
+    message = None
+    with open(fileName, 'r') as file:
+        for line in file:
+            text = line.strip()
+            if text.startswith('***ERROR') or text.startswith('***WARNING'):
+                message = [text]
+                if text.startswith('***ERROR'):
+                    errors.append(message)
+                else:
+                    warnings.append(message)
+            elif message is not None and line.startswith('    ') and text != '':
+                message.append(text)
+            else:
+                message = None
+    errors = [' '.join(message) for message in errors]
+    warnings = [' '.join(message) for message in warnings]
+    return errors, warnings
+
+def datNodePrint(fileName):
+    """
+
+    **Read the node output tables of** ``*Node Print`` **requests from the Abaqus** ``.dat`` **file.**
+
+    The file is read line by line, only the node output tables and the total time of each increment are kept.
+
+    :Parameters:
+
+        **fileName** (`str`): path to the `.dat` file including the file name and extension.
+
+    :return:
+
+        **NodePrint** (`dict`): One dictionary for each node set with the set name as key, with the key ``'Time'`` (`numpy.ndarray`) for the total time of the printed increments, ``'Node'`` (`list`) for the node labels and one (increments × nodes) `numpy.ndarray` for each printed variable, e.g. ``'RF1'`` or ``'U3'``.
+
+    .. dropdown:: Example
+
+        If ``filename.dat`` file has the following content for each increment,
+
+        .. code:: none
+
+                                               N O D E   O U T P U T
+
+            THE FOLLOWING TABLE IS PRINTED FOR NODES BELONGING TO NODE SET ASSEMBLY_TOPL
+
+              NODE FOOT-    RF1          RF2          RF3          U1           U2           U3
+                    NOTE
+
+                  2      1.887E-03    0.000       0.6900       0.000        0.000        2.000
+
+        then
+
+        .. code-block:: python
+
+            NodePrint = datNodePrint("filename.dat")
+            print(NodePrint['ASSEMBLY_TOPL']['U3'][:,0])
+
+    .. admonition:: Metadata
+
+        .. tabbed:: Environment
+
+            :badge:`Python,badge-primary`
+
+        .. tabbed:: Version
+
+            v1.2.0
+
+        .. tabbed:: Date
+
+            2026-10-19
+
+    """
+    import numpy as np
+    NodePrint = {}
+    time = 0.0
+    table = None
+    columns = None
+    with open(fileName, 'r') as file:
+        for line in file:
+            text = line.strip()
+            if 'TOTAL TIME COMPLETED' in text:
+                time = float(text.split()[-1])
+            elif text.startswith('THE FOLLOWING TABLE IS PRINTED FOR NODES BELONGING TO NODE SET'):
+                nodeSet = text.split()[-1]
+                if nodeSet not in NodePrint:
+                    NodePrint[nodeSet] = {'Time': [], 'Node': [], 'Rows': []}
+                table = NodePrint[nodeSet]
+                columns = None
+            elif table is None:
+                continue
+            elif text.startswith('NODE FOOT-'):
+                columns = text.split()[2:]
+                table['Columns'] = columns
+                table['Time'].append(time)
+                table['Rows'].append([])
+            elif columns is None or text == 'NOTE':
+                continue
+            elif text == '':
+                if len(table['Rows'][-1]) != 0:
+                    table = None
+            else:
+                entries = text.split()
+                try:
+                    table['Rows'][-1].append([float(x) for x in entries[-len(columns):]])
+                except ValueError:
+                    table = None
+                    continue
+                if len(table['Rows']) == 1:
+                    table['Node'].append(entries[0])
+    for nodeSet, table in NodePrint.items():
+        # Rows of all increments as (increments x nodes x variables)
+        Rows = np.array(table.pop('Rows'))
+        columns = table.pop('Columns')
+        table['Time'] = np.array(table['Time'])
+        for j in range(len(columns)):
+            table[columns[j]] = Rows[:,:,j]
+    return NodePrint
+
+def datResults(dict):
+    """
+
+    **Calculates the effective displacement and reaction force from the** ``*Node Print`` **output in the** ``.dat`` **file.**
+
+    Reads the output of the builders' ``'nodePrint'`` option (see :func:`czmtestkit.abaqus_modules.printRequests`) with :func:`datNodePrint` and returns the same data as :func:`Results`, without the ``.odb`` file or an Abaqus licence.
+    The initial state (zero reaction force and displacement), which is not printed to the ``.dat`` file, is added as the first point.
+
+    :Parameters:
+
+        **dict** (`dict`): Input data of the test, see :func:`Results`.
+
+            :'JobID': (`str`) File name of the `.dat` file.
+
+            :'Width': (`float`) Actual width of the specimen, used as a multiplier of the reaction force.
+
+            :'symmetric': (`bool`) [optional] ``True`` for the half-symmetry model, the displacement is doubled.
+
+    :return:
+
+        **OutputData** (`dict`): Keys ``'Reaction Force'``, ``'Displacement'`` and ``'NodeSet'`` as :func:`Results`. ``None`` if the `.dat` file does not contain node output of ``RF`` and ``U``.
+
+    .. dropdown:: Example
+
+        .. code-block:: python
+
+            FixDict['nodePrint'] = True
+            run_sim('ExampleDOE', VarDict, FixDict, abaqus_simFunc="czmtestkit.abaqus_modules.ADCB2", postProc=datResults, solver=True)
+
+    .. admonition:: Metadata
+
+        .. tabbed:: Environment
+
+            :badge:`Python,badge-primary`
+
+        .. tabbed:: Version
+
+            v1.2.0
+
+        .. tabbed:: Date
+
+            2026-10-19
+
+    """
+    import os
+    import numpy as np
+    Name = dict['JobID']
+    Width = dict['Width']
+    if not os.path.exists(Name+'.dat'):
+        print("The file does not exist")
+        return None
+    for nodeSet, table in datNodePrint(Name+'.dat').items():
+        RF = [key for key in sorted(table.keys()) if key.startswith('RF') and key[2:].isdigit()]
+        U = [key for key in sorted(table.keys()) if key.startswith('U') and key[1:].isdigit()]
+        if len(RF) == 0 or len(U) == 0:
+            continue
+        ReactionForce = Width*np.sqrt(np.sum([table[key]**2 for key in RF], axis=0))
+        Displacement = np.sqrt(np.sum([table[key]**2 for key in U], axis=0))
+        if dict.get('symmetric') is True:
+            Displacement = 2*Displacement
+        NodeSet = []
+        for label in table['Node']:
+            if label.isdigit():
+                label = 'ASSEMBLY.'+label
+            NodeSet.append('Node '+label)
+        return {'NodeSet': NodeSet, 'Reaction Force': [0.0]+ReactionForce[:,0].tolist(), 'Displacement': [0.0]+Displacement[:,0].tolist()}
+    return None
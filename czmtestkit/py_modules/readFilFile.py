@@ -0,0 +1,180 @@
+# Names of common record types of the results file
+FilRecordNames = {1: 'Element', 5: 'SDV', 11: 'S', 21: 'E', 101: 'U', 104: 'RF', 107: 'COORD'}
+
+def filIncrements(fileName, keys=None, blocks=1024):
+    """
+
+    **Read the node and element output of an Abaqus results file** ``.fil`` **increment by increment.**
+
+    ASCII (``*File Format, ASCII``) and binary files are supported, see :func:`czmtestkit.abaqus_modules.printRequests` to request the output.
+    The file is read in chunks of `blocks` blocks of 512 words, and the records of each increment (from record 2000 to record 2001) are converted to arrays in bulk and yielded before the next increment is read, so the memory stays bounded by the size of one increment.
+
+    :Parameters:
+
+        **fileName** (`str`): path to the `.fil` file including the file name and extension.
+
+        **keys** (`list`): Record type keys to be read, e.g. ``[101, 104]`` for ``U`` and ``RF`` [optional, default all node and element output records].
+
+        **blocks** (`int`): Number of blocks read at a time.
+
+    :return:
+
+        (`generator`) One dictionary for each increment with the keys ``'Step'``, ``'Increment'``, ``'Total Time'``, ``'Step Time'`` and one dictionary for each record type, named as in ``czmtestkit.py_modules.FilRecordNames`` or with the record type key, with the items:
+
+            :'Node': (`numpy.ndarray`) Node labels of nodal output records (keys 101 to 199).
+
+            :'Element', 'Point': (`numpy.ndarray`) Element labels and integration points of element output records, from the preceding element header record (key 1).
+
+            :'Values': (`numpy.ndarray`) Data of the records, one row per record.
+
+    .. dropdown:: Example
+
+        .. code-block:: python
+
+            for increment in filIncrements('ExampleJob.fil', keys=[101, 104]):
+                print(increment['Total Time'], increment['RF']['Values'][:,2], increment['U']['Values'][:,2])
+
+    .. admonition:: Metadata
+
+        .. tabbed:: Environment
+
+            :badge:`Python,badge-primary`
+
+        .. tabbed:: Version
+
+            v1.2.0
+
+        .. tabbed:: Date
+
+            2026-10-19
+
+    """
+    import numpy as np
+    with open(fileName, 'rb') as file:
+        binary = file.read(1) != b'*'
+    if binary:
+        words = _filBinaryWords(fileName, blocks)
+    else:
+        words = _filAsciiWords(fileName, blocks*512)
+    ints = np.zeros(0, dtype=np.int64)
+    floats = np.zeros(0)
+    increment = None
+    for newInts, newFloats in words:
+        ints = np.concatenate([ints, newInts])
+        floats = np.concatenate([floats, newFloats])
+        # Walking the complete records of the buffer
+        position = 0
+        starts = []
+        while position < len(ints):
+            length = int(ints[position])
+            if length < 2 or position+length > len(ints):
+                break
+            starts.append(position)
+            position += length
+        starts = np.array(starts, dtype=np.int64)
+        recordKeys = ints[starts+1] if len(starts) != 0 else np.zeros(0, dtype=np.int64)
+        first = 0
+        for i in np.nonzero((recordKeys == 2000) | (recordKeys == 2001))[0]:
+            if recordKeys[i] == 2000:
+                increment = {'Total Time': float(floats[starts[i]+2]), 'Step Time': float(floats[starts[i]+3]),
+                    'Step': int(ints[starts[i]+7]), 'Increment': int(ints[starts[i]+8])}
+                first = i+1
+            elif increment is not None:
+                increment.update(_filOutput(ints, floats, starts[first:i], recordKeys[first:i], keys))
+                yield increment
+                increment = None
+                first = i+1
+        # Records of an incomplete increment are kept in the buffer
+        if increment is not None and first < len(starts):
+            position = starts[first]
+        ints = ints[position:]
+        floats = floats[position:]
+
+def _filOutput(ints, floats, starts, recordKeys, keys):
+    """
+    Arrays of the output records of one increment, see :func:`filIncrements`.
+    """
+    import numpy as np
+    Output = {}
+    # Element label and integration point from the last element header record
+    header = np.where(recordKeys == 1, np.arange(len(recordKeys)), -1)
+    header = np.maximum.accumulate(header) if len(header) != 0 else header
+    for key in np.unique(recordKeys):
+        if key == 1 or key >= 1500 or (keys is not None and key not in keys):
+            continue
+        records = np.nonzero(recordKeys == key)[0]
+        lengths = ints[starts[records]]
+        width = int(lengths.max())-2
+        columns = np.arange(width)
+        index = starts[records][:,None]+2+columns
+        valid = columns[None,:] < (lengths[:,None]-2)
+        Values = np.where(valid, floats[np.where(valid, index, 0)], np.nan)
+        if 101 <= key < 200:
+            data = {'Node': ints[starts[records]+2], 'Values': Values[:,1:]}
+        else:
+            headers = starts[header[records]]
+            data = {'Element': ints[headers+2], 'Point': ints[headers+3], 'Values': Values}
+        Output[FilRecordNames.get(int(key), str(key))] = data
+    return Output
+
+def _filBinaryWords(fileName, blocks):
+    """
+    Words of a binary results file as integer and float arrays, `blocks` blocks of 512 words (with 4 byte markers) at a time.
+    """
+    import numpy as np
+    with open(fileName, 'rb') as file:
+        chunk = file.read(blocks*4104)
+        while len(chunk) >= 4104:
+            data = np.frombuffer(chunk[:len(chunk)//4104*4104], dtype=np.uint8).reshape(-1, 4104)[:,4:4100]
+            data = np.ascontiguousarray(data).reshape(-1)
+            yield data.view('<i8'), data.view('<f8')
+            chunk = file.read(blocks*4104)
+
+def _filAsciiWords(fileName, words):
+    """
+    Words of an ASCII results file as integer and float arrays, about `words` words at a time.
+    Integers are written as ``I`` with the number of digits (2 characters) and the digits, floats as ``D`` with 22 characters and strings as ``A`` with 8 characters.
+    """
+    import numpy as np
+    text = ''
+    ints = []
+    floats = []
+    with open(fileName, 'r') as file:
+        for line in file:
+            text = text + line.rstrip('\r\n')
+            position = 0
+            while position < len(text):
+                kind = text[position]
+                if kind == '*':
+                    position += 1
+                    continue
+                if kind == 'I':
+                    if position+3 > len(text):
+                        break
+                    width = int(text[position+1:position+3])
+                    end = position+3+width
+                    if end > len(text):
+                        break
+                    value = int(text[position+3:end])
+                    ints.append(value)
+                    floats.append(float(value))
+                elif kind == 'D':
+                    end = position+23
+                    if end > len(text):
+                        break
+                    ints.append(0)
+                    floats.append(float(text[position+1:end].replace('D', 'E')))
+                else:
+                    end = position+9
+                    if end > len(text):
+                        break
+                    ints.append(0)
+                    floats.append(0.0)
+                position = end
+            text = text[position:]
+            if len(ints) >= words:
+                yield np.array(ints, dtype=np.int64), np.array(floats)
+                ints = []
+                floats = []
+    if len(ints) != 0:
+        yield np.array(ints, dtype=np.int64), np.array(floats)
@@ -0,0 +1,256 @@
+class inpKeyword:
+    """
+
+    **Keyword block of an Abaqus** ``.inp`` **file indexed by** :class:`inpFile`.
+
+    The data lines of the block are read from the file only when :meth:`inpKeyword.lines` or :meth:`inpKeyword.array` is called for the first time.
+
+    :Attributes:
+
+        **inpKeyword.name** (`str`): Keyword in lower case without the leading ``*``, e.g. ``'element'`` or ``'cohesive section'``.
+
+        **inpKeyword.parameters** (`dict`): Parameters of the keyword line with lower case names as keys. Parameters without a value have the value ``None``.
+
+        **inpKeyword.start** (`int`): Byte offset of the keyword line in the `.inp` file.
+
+        **inpKeyword.dataStart** (`int`): Byte offset of the first data line.
+
+        **inpKeyword.stop** (`int`): Byte offset of the next keyword line or the end of the file.
+
+        **inpKeyword.part** (`str`): Name of the part the block is defined in. ``None`` outside of parts.
+
+        **inpKeyword.instance** (`str`): Name of the instance the block is defined in. ``None`` outside of instances.
+
+        **inpKeyword.fileName** (`str`): path to the `.inp` file including the file name and extension.
+
+    .. admonition:: Metadata
+
+        .. tabbed:: Environment
+
+            :badge:`Python,badge-primary`
+
+        .. tabbed:: Version
+
+            v1.2.0
+
+        .. tabbed:: Date
+
+            2026-10-19
+
+    """
+    def __init__(self, fileName, name, parameters, start, dataStart, part=None, instance=None):
+        self.fileName = fileName
+        self.name = name
+        self.parameters = parameters
+        self.start = start
+        self.dataStart = dataStart
+        self.stop = dataStart
+        self.part = part
+        self.instance = instance
+        self._lines = None
+
+    def lines(self):
+        """
+        **Data lines of the keyword block without comment lines.**
+
+        :return:
+
+            (`list`) Data lines as `str` without line endings.
+        """
+        if self._lines is None:
+            with open(self.fileName, 'rb') as file:
+                file.seek(self.dataStart)
+                text = file.read(self.stop-self.dataStart).decode('latin-1')
+            self._lines = [line.rstrip('\r') for line in text.split('\n') if line.strip() != '' and not line.startswith('**')]
+        return self._lines
+
+    def array(self, dtype=float):
+        """
+        **Data of the keyword block as an array.**
+
+        Lines ending with a comma are joined with the following line, e.g. elements with more than 15 nodes.
+
+        :Parameters:
+
+            **dtype** (`type`): Data type of the array.
+
+        :return:
+
+            (`numpy.ndarray`) One row for each data record.
+        """
+        import numpy as np
+        rows = []
+        entries = []
+        for line in self.lines():
+            entries.extend([entry for entry in line.split(',') if entry.strip() != ''])
+            if not line.rstrip().endswith(','):
+                rows.append(entries)
+                entries = []
+        if len(entries) != 0:
+            rows.append(entries)
+        return np.array(rows, dtype=float).astype(dtype)
+
+class inpFile:
+    """
+
+    **Index of the keyword blocks of an Abaqus** ``.inp`` **file.**
+
+    The file is scanned once for keyword lines, which are stored as :class:`inpKeyword` objects with their parameters, byte offsets and part/instance scope.
+    Data lines are not stored, such that large input files can be indexed with little memory and the data of the required blocks is read on access.
+
+    :Parameters:
+
+        **fileName** (`str`): path to the `.inp` file including the file name and extension.
+
+    :Attributes:
+
+        **inpFile.fileName** (`str`): path to the `.inp` file.
+
+        **inpFile.keywords** (`list`): :class:`inpKeyword` objects in the order of the file.
+
+        **inpFile.size** (`int`): Size of the file in bytes.
+
+    .. dropdown:: Example
+
+        .. code-block:: python
+
+            inp = inpFile('ExampleJob.inp')
+            for block in inp.find('element', type='COH3D8'):
+                print(block.part, block.array(int).shape)
+            section = inp.find('cohesive section')[0]
+            print(section.parameters['elset'])
+
+    .. admonition:: Metadata
+
+        .. tabbed:: Environment
+
+            :badge:`Python,badge-primary`
+
+        .. tabbed:: Version
+
+            v1.2.0
+
+        .. tabbed:: Date
+
+            2026-10-19
+
+    """
+    def __init__(self, fileName):
+        self.fileName = fileName
+        self.keywords = []
+        part = None
+        instance = None
+        block = None
+        keywordLine = None
+        offset = 0
+        with open(fileName, 'rb') as file:
+            for line in file:
+                start = offset
+                offset += len(line)
+                if keywordLine is not None:
+                    # Keyword line continued after a trailing comma
+                    keywordLine = keywordLine + line.decode('latin-1').strip()
+                    block.dataStart = offset
+                    block.stop = offset
+                    if not keywordLine.endswith(','):
+                        block.name, block.parameters = keywordParameters(keywordLine)
+                        keywordLine = None
+                    continue
+                if not line.startswith(b'*') or line.startswith(b'**'):
+                    if block is not None:
+                        block.stop = offset
+                    continue
+                text = line.decode('latin-1').strip()
+                name, parameters = keywordParameters(text)
+                if name == 'end part':
+                    part = None
+                elif name == 'end instance':
+                    instance = None
+                block = inpKeyword(fileName, name, parameters, start, offset, part, instance)
+                self.keywords.append(block)
+                if name == 'part':
+                    part = parameters.get('name')
+                elif name == 'instance':
+                    instance = parameters.get('name')
+                if text.endswith(','):
+                    keywordLine = text
+        self.size = offset
+
+    def find(self, name, part=False, instance=False, **parameters):
+        """
+        **Keyword blocks with the keyword** `name` **and the given parameter values.**
+
+        :Parameters:
+
+            **name** (`str`): Keyword, not case sensitive, e.g. ``'Element'``.
+
+            **part** (`str`): Name of the part. ``False``: blocks in any scope.
+
+            **instance** (`str`): Name of the instance. ``False``: blocks in any scope.
+
+            **parameters**: Parameter values of the blocks (not case sensitive), e.g. ``elset='Cz'``.
+
+        :return:
+
+            (`list`) :class:`inpKeyword` objects.
+        """
+        name = ' '.join(name.lower().lstrip('*').split())
+        blocks = []
+        for block in self.keywords:
+            if block.name != name:
+                continue
+            if part is not False and block.part != part:
+                continue
+            if instance is not False and block.instance != instance:
+                continue
+            match = True
+            for key, value in parameters.items():
+                found = block.parameters.get(key.lower())
+                if found is None or found.lower() != str(value).lower():
+                    match = False
+                    break
+            if match:
+                blocks.append(block)
+        return blocks
+
+def keywordParameters(line):
+    """
+    **Keyword and parameters of an Abaqus** ``.inp`` **keyword line.**
+
+    :Parameters:
+
+        **line** (`str`): Keyword line, e.g. ``'*Element, type=COH3D8, elset=Cz'``.
+
+    :return:
+
+        **name** (`str`): Keyword in lower case without the leading ``*``.
+
+        **parameters** (`dict`): Parameters with lower case names as keys. Parameters without a value have the value ``None``.
+
+    .. admonition:: Metadata
+
+        .. tabbed:: Environment
+
+            :badge:`Python,badge-primary`
+
+        .. tabbed:: Version
+
+            v1.2.0
+
+        .. tabbed:: Date
+
+            2026-10-19
+
+    """
+    entries = line.strip().lstrip('*').split(',')
+    name = ' '.join(entries[0].lower().split())
+    parameters = {}
+    for entry in entries[1:]:
+        if entry.strip() == '':
+            continue
+        if '=' in entry:
+            key, value = entry.split('=', 1)
+            parameters[' '.join(key.lower().split())] = value.strip()
+        else:
+            parameters[' '.join(entry.lower().split())] = None
+    return name, parameters
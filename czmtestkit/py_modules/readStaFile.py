@@ -0,0 +1,441 @@
+def staIncrements(fileName):
+    """
+
+    **Read the increment summary from the Abaqus** ``.sta`` **file.**
+
+    Each line of the summary corresponds to an attempt of an increment. Attempts that did not converge (cutbacks) are marked with ``U`` after the attempt number.
+
+    :Parameters:
+
+        **fileName** (`str`): path to the `.sta` file including the file name and extension.
+
+    :return:
+
+        **attempts** (`list`): Dictionaries with the keys ``'step'``, ``'inc'``, ``'attempt'``, ``'converged'``, ``'severe'``, ``'equil'``, ``'iters'`` and ``'incTime'`` (``None`` if not printed) for each attempt.
+
+    .. dropdown:: Example
+
+        If ``filename.sta`` file has the following content,
+
+        .. code:: none
+
+             STEP  INC ATT SEVERE EQUIL TOTAL  TOTAL      STEP       INC OF       DOF    IF
+                           DISCON ITERS ITERS  TIME/    TIME/LPF    TIME/LPF    MONITOR RIKS
+                           ITERS               FREQ
+               1     1   1     0     4     4  0.100      0.100      0.1000
+               1     2   1U    0    12    12  0.100      0.100      0.1000
+               1     2   2     0     6     6  0.125      0.125      0.02500
+
+        then
+
+        .. code-block:: python
+
+            attempts = staIncrements("filename.sta")
+            print([(a['inc'], a['attempt'], a['converged'], a['iters']) for a in attempts])
+
+        **Output**
+
+        ::
+
+            [(1, 1, True, 4), (2, 1, False, 12), (2, 2, True, 6)]
+
+    .. admonition:: Metadata
+
+        .. tabbed:: Environment
+
+            :badge:`Python,badge-primary`
+
+        .. tabbed:: Version
+
+            v1.2.0
+
+        .. tabbed:: Date
+
+            2026-10-19
+
+    """
+    attempts = []
+    with open(fileName, 'r') as file:
+        for line in file:
+            entry = _staAttempt(line)
+            if entry is not None:
+                attempts.append(entry)
+    return attempts
+
+def _staAttempt(line):
+    """
+    Attempt dictionary of :func:`staIncrements` for a line of the increment summary, ``None`` for other lines.
+    The step time (``'stepTime'``) is added, ``None`` if not printed.
+    """
+    entries = line.split()
+    if len(entries) < 6 or not entries[0].isdigit() or not entries[1].isdigit():
+        return None
+    attempt = entries[2]
+    converged = not attempt.endswith('U')
+    try:
+        incTime = float(entries[8])
+    except (IndexError, ValueError):
+        incTime = None
+    try:
+        stepTime = float(entries[7])
+    except (IndexError, ValueError):
+        stepTime = None
+    return {'step': int(entries[0]), 'inc': int(entries[1]),
+        'attempt': int(attempt.rstrip('U')), 'converged': converged,
+        'severe': int(entries[3]), 'equil': int(entries[4]), 'iters': int(entries[5]),
+        'incTime': incTime, 'stepTime': stepTime}
+
+def incrementTuner(staFiles, maxInc=0.1, targetIters=6):
+    """
+
+    **Propose incrementation parameters for the remaining points of a design of experiments from the** ``.sta`` **files of completed points.**
+
+    The increments before the first cutback (prior to crack initiation) are used to scale the maximum and the initial increment, such that the mean number of iterations per increment approaches `targetIters`.
+    The first cutback of a point marks the crack initiation, where the increment that converged before initiation is too large.
+    The size of the first increment that converged after the first cutback is the increment at initiation, and the smallest increment at initiation of all points caps the proposed maximum increment.
+    Since the maximum increment applies to the whole step, the cap also limits the increments prior to initiation, which are increased again by Abaqus after the increments with at most :math:`I_G` iterations.
+    The median number of iterations of converged increments sets the time incrementation control :math:`I_G` `[1]`_, so the increment is increased after increments with the typical number of iterations instead of being held at a constant size.
+
+    :Parameters:
+
+        **staFiles** (`list`): paths to the `.sta` files of completed points.
+
+        **maxInc** (`float`): Maximum increment used for the completed points.
+
+        **targetIters** (`int`): Target number of iterations per increment.
+
+    :return:
+
+        **proposal** (`dict`): Keys ``'initialInc'``, ``'maxInc'`` and ``'timeIncrementation'`` for the test dictionary (see :func:`czmtestkit.abaqus_modules.analysisStep`), ``'initiationInc'`` the smallest increment at initiation (``None`` if no point had a cutback) and ``'Summary'`` with the number of increments, attempts, iterations and cutbacks, the step time of the first cutback and the increment at initiation of each `.sta` file.
+
+    .. dropdown:: Example
+
+        .. code-block:: python
+
+            import glob
+            proposal = incrementTuner(glob.glob('ExampleDOE/point_0[0-2]/*.sta'))
+            for key in ['initialInc', 'maxInc', 'timeIncrementation']:
+                FixDict[key] = proposal[key]
+            run_sim('ExampleDOE', VarDict, FixDict, abaqus_simFunc="czmtestkit.abaqus_modules.ADCB2")
+
+    **References:**
+
+    .. _[1]:
+
+        1) Abaqus Analysis User's Guide, Section 7.2.4: Commonly used control parameters.
+
+    .. admonition:: Metadata
+
+        .. tabbed:: Environment
+
+            :badge:`Python,badge-primary`
+
+        .. tabbed:: Version
+
+            v1.2.0
+
+        .. tabbed:: Date
+
+            2026-10-19
+
+    """
+    import numpy as np
+    earlyIters = []
+    convergedIters = []
+    initiationIncs = []
+    Summary = []
+    for fileName in staFiles:
+        attempts = staIncrements(fileName)
+        if len(attempts) == 0:
+            continue
+        cutback = False
+        cutbacks = {}
+        firstCutback = None
+        initiationInc = None
+        for entry in attempts:
+            if not entry['converged']:
+                if not cutback:
+                    firstCutback = entry['stepTime']
+                cutback = True
+                key = (entry['step'], entry['inc'])
+                cutbacks[key] = cutbacks.get(key, 0) + 1
+            elif not cutback:
+                earlyIters.append(entry['iters'])
+            elif initiationInc is None:
+                # First increment converged after the first cutback
+                initiationInc = entry['incTime']
+            if entry['converged']:
+                convergedIters.append(entry['iters'])
+        if initiationInc is not None:
+            initiationIncs.append(initiationInc)
+        Summary.append({'File': fileName,
+            'Increments': len([entry for entry in attempts if entry['converged']]),
+            'Attempts': len(attempts),
+            'Iterations': sum([entry['iters'] for entry in attempts]),
+            'Cutbacks': sum(cutbacks.values()),
+            'First cutback': firstCutback,
+            'Initiation increment': initiationInc})
+    if len(Summary) == 0:
+        raise ValueError('No increments found in the .sta files')
+    for entry in Summary:
+        print('{File}: {Increments} increments, {Attempts} attempts, {Iterations} iterations, {Cutbacks} cutbacks, first cutback at step time {First cutback}, increment at initiation {Initiation increment}'.format(**entry))
+    # Scaling the increments with the convergence prior to crack initiation
+    if len(earlyIters) != 0:
+        ratio = min(max(targetIters/float(np.mean(earlyIters)), 0.5), 2.0)
+    else:
+        ratio = 0.5
+    newMaxInc = min(maxInc*ratio, 1.0)
+    # Increment at crack initiation
+    initiationInc = None
+    if len(initiationIncs) != 0:
+        initiationInc = min(initiationIncs)
+        newMaxInc = min(newMaxInc, initiationInc)
+    initialInc = newMaxInc
+    if len(earlyIters) != 0 and earlyIters[0] > targetIters:
+        initialInc = newMaxInc*0.5
+    # Increments are increased after consecutive increments with at most I_G iterations
+    IG = int(max(4, np.percentile(convergedIters, 50)))
+    timeIncrementation = (200.0, 200.0, 9.0, 200.0, 200.0, float(IG), 20.0, 50.0, 6.0, 3.0, 50.0)
+    proposal = {'initialInc': initialInc, 'maxInc': newMaxInc, 'timeIncrementation': timeIncrementation, 'initiationInc': initiationInc, 'Summary': Summary}
+    print('Proposed initialInc = {0}, maxInc = {1}, I_G = {2}'.format(initialInc, newMaxInc, IG))
+    return proposal
+
+class staTailer:
+    """
+
+    **Live progress of the tests of a design of experiments from the** ``.sta`` **and** ``.msg`` **files.**
+
+    Each call of :meth:`staTailer.update` reads only the bytes appended to the ``.sta`` and ``.msg`` file of each test since the previous call, starting from the stored byte offsets, so the files of running jobs can be polled at a negligible I/O cost.
+    The fraction of the step completed is taken from the ``FRACTION OF STEP COMPLETED`` lines of the ``.msg`` file, or from the step time in the ``.sta`` file divided by `timePeriod` if the ``.msg`` file has no such lines.
+    The estimated time remaining (ETA) of a test is extrapolated from its progress since the start time in the first line of the ``.sta`` file.
+    The run time of completed and failed tests is the wallclock time of the job time summary in the ``.msg`` or ``.dat`` file (see :func:`wallclockTime`), or the time between the start and the last modification of the ``.sta`` file if there is no summary.
+    The ETA of the design of experiments adds the remaining tests without a ``.sta`` file, run in `nJobs` parallel jobs with the mean estimated duration of the started tests, to the largest ETA of the running tests.
+
+    :Parameters:
+
+        **name** (`str`): ID for colleciton of tests in the design of experiments, i.e. the directory with the ``point_##`` directories of :func:`run_sim`.
+
+        **nJobs** (`int`): Number of jobs run in parallel.
+
+        **timePeriod** (`float`): Time period of the step, used if the ``.msg`` file has no ``FRACTION OF STEP COMPLETED`` lines.
+
+    :Attributes:
+
+        **staTailer.points** (`dict`): State of each test with the point name as key and the keys ``'JobID'``, ``'Status'`` (``'queued'``, ``'running'``, ``'completed'`` or ``'failed'``), ``'Step'``, ``'Increment'``, ``'Cutbacks'``, ``'Iterations'``, ``'Fraction'``, ``'Start'``, ``'Wallclock'`` (wallclock time of the job time summary), ``'Elapsed'``, ``'ETA'`` and the byte offsets ``'staOffset'`` and ``'msgOffset'``.
+
+        **staTailer.eta** (`float`): Estimated time remaining of the design of experiments in seconds, ``None`` before any test has progressed.
+
+    .. dropdown:: Example
+
+        .. code-block:: python
+
+            # In a second Python session while run_sim('ExampleDOE', VarDict, FixDict, ..., solver=True, nJobs=4) is running
+            tailer = staTailer('ExampleDOE', nJobs=4)
+            tailer.watch(interval=60)
+
+        **Output**
+
+        ::
+
+            Point        Status       Step   Inc  Cutbacks  Fraction  Elapsed (s)   ETA (s)
+            point_00     completed       1    52         3     1.000        412.0       0.0
+            point_01     running         1    31         9     0.480        398.0     431.2 *
+            point_02     running         1    40         2     0.710        290.0     118.5
+            point_03     queued
+            ETA of ExampleDOE: 549.9 s
+
+        Tests with an estimated duration of more than 1.5 times the median of the started tests are marked with ``*``.
+
+    .. admonition:: Metadata
+
+        .. tabbed:: Environment
+
+            :badge:`Python,badge-primary`
+
+        .. tabbed:: Version
+
+            v1.2.0
+
+        .. tabbed:: Date
+
+            2026-10-19
+
+    """
+    def __init__(self, name, nJobs=1, timePeriod=1.0):
+        self.name = name
+        self.nJobs = nJobs
+        self.timePeriod = timePeriod
+        self.points = {}
+        self.eta = None
+
+    def update(self):
+        """
+        **Read the new lines of the** ``.sta`` **and** ``.msg`` **files of all tests and update the estimates.**
+
+        :return:
+
+            (`list`) State dictionaries of the tests (see :attr:`staTailer.points`) with the key ``'Point'``, sorted by point name.
+        """
+        import os
+        import glob
+        import json
+        import time
+        from .readDatFile import wallclockTime
+        now = time.time()
+        for path in sorted(glob.glob(os.path.join(self.name, 'point_*'))):
+            point = os.path.basename(path)
+            if point not in self.points:
+                try:
+                    with open(os.path.join(path, point+'.json'), 'r') as file:
+                        JobID = json.loads(file.readline())['JobID']
+                except (IOError, OSError, ValueError, KeyError):
+                    continue
+                self.points[point] = {'JobID': JobID, 'Status': 'queued', 'Step': None, 'Increment': None,
+                    'Cutbacks': 0, 'Iterations': 0, 'Fraction': 0.0, 'msgFraction': False, 'Start': None, 'Wallclock': None,
+                    'Elapsed': None, 'ETA': None, 'staOffset': 0, 'msgOffset': 0}
+            state = self.points[point]
+            if state['Status'] in ['completed', 'failed']:
+                continue
+            base = os.path.join(path, state['JobID'])
+            for line in self._newLines(state, 'msgOffset', base+'.msg'):
+                if 'WALLCLOCK TIME (SEC)' in line:
+                    # Job time summary at the end of the analysis
+                    try:
+                        state['Wallclock'] = float(line.split('=')[-1])
+                    except ValueError:
+                        pass
+                elif 'FRACTION OF STEP COMPLETED' in line:
+                    try:
+                        state['Fraction'] = float(line.split()[-1])
+                        state['msgFraction'] = True
+                    except ValueError:
+                        pass
+            for line in self._newLines(state, 'staOffset', base+'.sta'):
+                if state['Status'] == 'queued':
+                    state['Status'] = 'running'
+                    state['Start'] = _staStart(line, now)
+                entry = _staAttempt(line)
+                if entry is not None:
+                    state['Iterations'] += entry['iters']
+                    if not entry['converged']:
+                        state['Cutbacks'] += 1
+                        continue
+                    if entry['step'] != state['Step'] and state['Step'] is not None and not state['msgFraction']:
+                        state['Fraction'] = 0.0
+                    state['Step'] = entry['step']
+                    state['Increment'] = entry['inc']
+                    if not state['msgFraction'] and entry['stepTime'] is not None:
+                        state['Fraction'] = min(entry['stepTime']/self.timePeriod, 1.0)
+                elif 'COMPLETED SUCCESSFULLY' in line:
+                    state['Status'] = 'completed'
+                    state['Fraction'] = 1.0
+                elif 'NOT BEEN COMPLETED' in line:
+                    state['Status'] = 'failed'
+            if state['Start'] is None:
+                continue
+            if state['Status'] == 'running':
+                state['Elapsed'] = now-state['Start']
+                if state['Fraction'] > 0:
+                    state['ETA'] = state['Elapsed']*(1.0-state['Fraction'])/state['Fraction']
+            else:
+                # Run time from the job time summary, the modification time of copied files is not the end of the run
+                if state['Wallclock'] is None:
+                    state['Wallclock'] = wallclockTime(base+'.dat')
+                if state['Wallclock'] is not None:
+                    state['Elapsed'] = state['Wallclock']
+                else:
+                    state['Elapsed'] = os.path.getmtime(base+'.sta')-state['Start']
+                state['ETA'] = 0.0
+        self.eta = self._doeEta()
+        table = []
+        for point in sorted(self.points.keys()):
+            entry = dict(self.points[point])
+            entry['Point'] = point
+            table.append(entry)
+        return table
+
+    def report(self):
+        """
+        **Update and print the progress table of the design of experiments.**
+
+        Tests with an estimated duration of more than 1.5 times the median of the started tests are marked with ``*``.
+        """
+        import numpy as np
+        table = self.update()
+        durations = self._durations()
+        median = np.median(list(durations.values())) if len(durations) != 0 else None
+        print('{0:<12} {1:<10} {2:>6} {3:>5} {4:>9} {5:>9} {6:>12} {7:>9}'.format('Point', 'Status', 'Step', 'Inc', 'Cutbacks', 'Fraction', 'Elapsed (s)', 'ETA (s)'))
+        for entry in table:
+            if entry['Start'] is None:
+                print('{0:<12} {1:<10}'.format(entry['Point'], entry['Status']))
+                continue
+            eta = '' if entry['ETA'] is None else '{0:.1f}'.format(entry['ETA'])
+            flag = ' *' if median is not None and durations.get(entry['Point'], 0) > 1.5*median else ''
+            print('{0:<12} {1:<10} {2:>6} {3:>5} {4:>9} {5:>9.3f} {6:>12.1f} {7:>9}{8}'.format(entry['Point'], entry['Status'],
+                entry['Step'] or '', entry['Increment'] or '', entry['Cutbacks'], entry['Fraction'], entry['Elapsed'], eta, flag))
+        if self.eta is not None:
+            print('ETA of {0}: {1:.1f} s'.format(self.name, self.eta))
+
+    def watch(self, interval=60):
+        """
+        **Print the progress table every** `interval` **seconds until all tests are completed or failed.**
+
+        :Parameters:
+
+            **interval** (`float`): Time between updates in seconds.
+        """
+        import time
+        while True:
+            self.report()
+            if len(self.points) != 0 and all([state['Status'] in ['completed', 'failed'] for state in self.points.values()]):
+                return
+            time.sleep(interval)
+
+    def _newLines(self, state, key, fileName):
+        """
+        Complete lines appended to `fileName` since the offset ``state[key]``, which is moved to the end of the last complete line.
+        """
+        import os
+        if not os.path.exists(fileName) or os.path.getsize(fileName) <= state[key]:
+            return []
+        with open(fileName, 'rb') as file:
+            file.seek(state[key])
+            text = file.read()
+        end = text.rfind(b'\n')+1
+        state[key] += end
+        return text[:end].decode('latin-1').splitlines()
+
+    def _durations(self):
+        """
+        Estimated total duration of the started tests.
+        """
+        durations = {}
+        for point, state in self.points.items():
+            if state['Status'] == 'completed' or (state['Status'] == 'running' and state['ETA'] is not None):
+                durations[point] = state['Elapsed']+state['ETA']
+        return durations
+
+    def _doeEta(self):
+        """
+        Estimated time remaining of the design of experiments, see :class:`staTailer`.
+        """
+        import numpy as np
+        durations = list(self._durations().values())
+        if len(durations) == 0:
+            return None
+        running = [state['ETA'] for state in self.points.values() if state['Status'] == 'running' and state['ETA'] is not None]
+        queued = len([state for state in self.points.values() if state['Status'] == 'queued'])
+        return max(running+[0.0]) + np.ceil(queued/float(self.nJobs))*np.mean(durations)
+
+def _staStart(line, default):
+    """
+    Start time of the job in seconds since the epoch from the first line of the ``.sta`` file, e.g. ``Abaqus/Standard 2020  DATE 08-Mar-2022 TIME 11:52:32``. `default` if the line has no date.
+    """
+    import time
+    entries = line.split()
+    try:
+        date = entries[entries.index('DATE')+1]
+        clock = entries[entries.index('TIME')+1]
+        return time.mktime(time.strptime(date+' '+clock, '%d-%b-%Y %H:%M:%S'))
+    except (ValueError, IndexError):
+        return default
@@ -0,0 +1,150 @@
+def writeRestartInput(Name, newName, scale, step=1):
+    """
+
+    **Write an Abaqus restart input file that continues an analysis with scaled boundary conditions.**
+
+    The first step (``*Step`` to ``*End Step``) of ``Name.inp`` is copied as a new step with number ``step+1`` after ``*Restart, read, step=step``.
+    Non-zero magnitudes of prescribed boundary conditions in the copied step are multiplied by `scale`, which continues the loading from the end of the previous step to the new target.
+
+    :Parameters:
+
+        **Name** (`str`): ``.inp`` file name of the original analysis (without extension).
+
+        **newName** (`str`): ``.inp`` file name of the restart analysis (without extension).
+
+        **scale** (`float`): Ratio of the new to the original magnitude of the applied displacement.
+
+        **step** (`int`): Last step of the job with the restart data.
+
+    .. dropdown:: Example
+
+        .. tabs::
+
+            .. tab:: ExampleJob.inp::
+
+                ::
+
+                    ...
+                    *Step, name=Step-1, nlgeom=YES, inc=1000000000, unsymm=YES
+                    ...
+                    *Boundary
+                    TopL, 1, 1
+                    TopL, 3, 3, 20.
+                    ...
+                    *End Step
+
+        Executing ``writeRestartInput('ExampleJob', 'ExampleJob_ext1', 1.5)`` results in
+
+        .. tabs::
+
+            .. tab:: ExampleJob_ext1.inp::
+
+                ::
+
+                    *Heading
+                    ** Continuation of ExampleJob
+                    *Restart, read, step=1
+                    *Step, name=Step-2, nlgeom=YES, inc=1000000000, unsymm=YES
+                    ...
+                    *Boundary
+                    TopL, 1, 1
+                    TopL, 3, 3, 30.0
+                    ...
+                    *End Step
+
+    .. admonition:: Metadata
+
+        .. tabbed:: Environment
+
+            :badge:`Python,badge-primary`
+
+        .. tabbed:: Version
+
+            v1.2.0
+
+        .. tabbed:: Date
+
+            2026-10-19
+
+    """
+    import re
+    with open(Name+'.inp', 'r') as file:
+        Input = file.read().split('\n')
+    Keys = [line.strip().lower() for line in Input]
+    start = [idx for idx in range(len(Keys)) if Keys[idx].startswith('*step')][0]
+    stop = [idx for idx in range(start, len(Keys)) if Keys[idx].startswith('*end step')][0]
+    Output = ['*Heading', '** Continuation of '+Name, '*Restart, read, step='+str(step)]
+    boundary = False
+    for line in Input[start:stop+1]:
+        if line.startswith('*') and not line.startswith('**'):
+            boundary = line.lower().startswith('*boundary')
+            if line.lower().startswith('*step'):
+                line = re.sub(r'name=[^,]*', 'name=Step-'+str(step+1), line)
+        elif boundary and not line.startswith('**'):
+            entries = line.split(',')
+            if len(entries) > 3 and entries[3].strip() != '' and float(entries[3]) != 0.0:
+                entries[3] = ' '+repr(float(entries[3])*scale)
+                line = ','.join(entries)
+        Output.append(line)
+    with open(newName+'.inp', 'w') as file:
+        file.write('\n'.join(Output)+'\n')
+
+def appendHistory(Name, newName):
+    """
+
+    **Append the history output of a restart analysis to the history output of the original analysis.**
+
+    The files are written by :func:`czmtestkit.abaqus_modules.historyOutput`: ``.csv``, ``_model.csv`` (outputs without components) and ``.npz``.
+    The first row of ``newName.csv`` and ``newName_model.csv`` (start of the new step) repeats the last row of the original file and is skipped, as are the rows of the ``.npz`` arrays up to the last total time of the original arrays.
+    Files of the original analysis without a counterpart of the restart analysis are removed, such that :func:`resultArrays` does not read history output that ends before the restart.
+
+    :Parameters:
+
+        **Name** (`str`): File name of the original analysis (without extension).
+
+        **newName** (`str`): File name of the restart analysis (without extension).
+
+    .. admonition:: Metadata
+
+        .. tabbed:: Environment
+
+            :badge:`Python,badge-primary`
+
+        .. tabbed:: Version
+
+            v1.2.0
+
+        .. tabbed:: Date
+
+            2026-10-19
+
+    """
+    import os
+    import numpy as np
+    for suffix, header in [('.csv', 3), ('_model.csv', 2)]:
+        if not os.path.exists(Name+suffix):
+            continue
+        if not os.path.exists(newName+suffix):
+            os.remove(Name+suffix)
+            continue
+        with open(Name+suffix, 'r') as file:
+            Rows = [line.rstrip('\r\n') for line in file if line.strip() != '']
+        with open(newName+suffix, 'r') as file:
+            NewRows = [line.rstrip('\r\n') for line in file if line.strip() != '']
+        if Rows[:header] != NewRows[:header]:
+            raise ValueError('The history output of '+newName+' does not match the history output of '+Name)
+        with open(Name+suffix, 'w') as file:
+            file.write('\n'.join(Rows+NewRows[header+1:])+'\n')
+    if os.path.exists(Name+'.npz'):
+        if not os.path.exists(newName+'.npz'):
+            os.remove(Name+'.npz')
+            return
+        with np.load(Name+'.npz') as Old:
+            with np.load(newName+'.npz') as New:
+                if sorted(Old.files) != sorted(New.files):
+                    raise ValueError('The history output of '+newName+' does not match the history output of '+Name)
+                Arrays = {}
+                for key in Old.files:
+                    last = Old[key][-1,0] if len(Old[key]) != 0 else -np.inf
+                    Arrays[key] = np.concatenate([Old[key], New[key][New[key][:,0] > last]])
+        np.savez(Name+'.npz', **Arrays)
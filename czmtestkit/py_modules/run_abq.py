@@ -91,4 +91,367 @@ def abqFun(InputData, function, wd):
 	runCommand = ['cmd.exe','/c','abaqus','cae','noGui=abqScript.py']
 	process = subprocess.Popen(runCommand, shell=True)
 	process.wait()
-	os.chdir(cwd)
\ No newline at end of file
+	os.chdir(cwd)
+def abqJob(job, wd, inputFile=None, oldjob=None, user=None, nCpu=1, wait=True, datacheck=False):
+	"""
+
+	**Run an Abaqus analysis from an input file as a subprocess.**
+
+	:Parameters:
+
+		**job** (`str`): Name of the job.
+
+		**wd** (`str`): work directory with the input file.
+
+		**inputFile** (`str`): Name of the ``.inp`` file [optional, default `job`].
+
+		**oldjob** (`str`): Name of the job with the restart data to continue from [optional].
+
+		**user** (`str`): User subroutine file [optional].
+
+		**nCpu** (`int`): Number of CPUs.
+
+		**datacheck** (`bool`): ``True``: only the datacheck of the input file is run, see :func:`datMessages` to read the errors from the ``.dat`` file.
+
+		**wait** (`bool`): ``True``: wait for the analysis to complete. ``False``: return immediately to run several analyses concurrently.
+
+	:return:
+
+		**returncode** (`int`): Exit status of the ``abaqus`` command if `wait` is ``True``, otherwise the ``subprocess.Popen`` object of the running command.
+
+	.. dropdown:: Example
+
+		Continue the analysis ``ExampleJob`` with the restart input file ``ExampleJob_ext1.inp`` in the current working directory:
+
+		.. code-block:: python
+
+			import os
+			czmtestkit.py_modules.abqJob('ExampleJob_ext1', os.getcwd(), oldjob='ExampleJob')
+
+	.. admonition:: Metadata
+
+		.. tabbed:: Environment
+
+			:badge:`Python,badge-primary`
+
+		.. tabbed:: Version
+
+			v1.2.0
+
+		.. tabbed:: Date
+
+			2026-10-19
+
+	"""
+	import os
+	import subprocess
+	if inputFile is None:
+		inputFile = job
+	runCommand = ['abaqus', 'job='+job, 'input='+inputFile, 'cpus='+str(nCpu)]
+	if oldjob is not None:
+		runCommand.append('oldjob='+oldjob)
+	if user is not None:
+		runCommand.append('user='+user)
+	if datacheck is True:
+		runCommand.append('datacheck')
+	runCommand.extend(['ask_delete=OFF', 'interactive'])
+	if os.name == 'nt':
+		runCommand = ['cmd.exe', '/c'] + runCommand
+	process = subprocess.Popen(runCommand, cwd=wd)
+	if wait is False:
+		return process
+	return process.wait()
+
+def abqEnv(wd, profile):
+	"""
+
+	**Write an** ``abaqus_v6.env`` **file with solver parallelism and memory settings to a work directory.**
+
+	The ``abaqus_v6.env`` file in the work directory takes precedence over the site and home environment files for analyses run in this directory.
+
+	:Parameters:
+
+		**wd** (`str`): work directory.
+
+		**profile** (`dict`): Tuning profile with the following optional keys.
+
+			:'cpus': (`int`) Number of CPUs. Also passed to the ``abaqus`` command by :func:`run_sim`.
+
+			:'gpus': (`int`) Number of GPUs for the direct solver.
+
+			:'mp_mode': (`str`) ``'threads'`` or ``'mpi'``.
+
+			:'standard_parallel': (`str`) ``'all'``: parallel element operations and solver. ``'solver'``: parallel solver only.
+
+			:'memory': (`str`) Memory available to the analysis, e.g. ``'90 %'`` or ``'16 gb'``.
+
+			:'scratch': (`str`) Directory for the scratch files, e.g. a local disk of the node.
+
+			:'order_parallelism': (`str`) Parallel ordering of the direct solver equations, ``'on'`` or ``'off'``.
+
+			:'extra': (`dict`) Additional environment file parameters written as ``key=value`` with the values formatted by ``repr``.
+
+	.. dropdown:: Example
+
+		.. code-block:: python
+
+			abqEnv('ExampleDOE/point_00', {'cpus': 8, 'mp_mode': 'threads', 'standard_parallel': 'all', 'memory': '80 %'})
+
+		.. tabs::
+
+			.. tab:: abaqus_v6.env::
+
+				::
+
+					cpus=8
+					mp_mode=THREADS
+					standard_parallel=ALL
+					memory="80 %"
+
+	.. admonition:: Metadata
+
+		.. tabbed:: Environment
+
+			:badge:`Python,badge-primary`
+
+		.. tabbed:: Version
+
+			v1.2.0
+
+		.. tabbed:: Date
+
+			2026-10-19
+
+	"""
+	import os
+	Lines = []
+	for key in ['cpus', 'gpus']:
+		if key in profile:
+			Lines.append(key+'='+str(int(profile[key])))
+	for key in ['mp_mode', 'standard_parallel', 'order_parallelism']:
+		if key in profile:
+			Lines.append(key+'='+str(profile[key]).upper())
+	for key in ['memory', 'scratch']:
+		if key in profile:
+			Lines.append(key+'="'+str(profile[key]).replace('\\', '/')+'"')
+	for key, value in profile.get('extra', {}).items():
+		Lines.append(key+'='+repr(value))
+	with open(os.path.join(wd, 'abaqus_v6.env'), 'w') as file:
+		file.write('\n'.join(Lines)+'\n')
+
+def abqLibrary(source, cacheDir, settings=''):
+	"""
+
+	**Compile a user subroutine into a shared library once and reuse it from a cache directory.**
+
+	The library is compiled with ``abaqus make library=...`` into the sub directory of `cacheDir` named after a hash of the content of `source`, `settings` and the platform.
+	Analyses link against the library when the sub directory is set as ``usub_lib_dir`` in the ``abaqus_v6.env`` file (see :func:`abqEnv`), instead of compiling the subroutine with ``user=...`` for every job.
+
+	:Parameters:
+
+		**source** (`str`): path to the Fortran source of the user subroutine.
+
+		**cacheDir** (`str`): path to the cache directory.
+
+		**settings** (`str`): Compiler settings that affect the library, e.g. the Abaqus release and the ``compile_fortran`` flags of the environment file. A new library is compiled when the settings change.
+
+	:return:
+
+		**libDir** (`str`): Absolute path of the directory with the compiled library.
+
+	.. dropdown:: Example
+
+		.. code-block:: python
+
+			libDir = abqLibrary('SDF.for', 'usubCache')
+			abqEnv('ExampleDOE/point_00', {'extra': {'usub_lib_dir': libDir}})
+
+	.. admonition:: Metadata
+
+		.. tabbed:: Environment
+
+			:badge:`Python,badge-primary`
+
+		.. tabbed:: Version
+
+			v1.2.0
+
+		.. tabbed:: Date
+
+			2026-10-19
+
+	"""
+	import os
+	import sys
+	import shutil
+	import hashlib
+	import subprocess
+	with open(source, 'rb') as file:
+		content = file.read()
+	key = hashlib.sha256(content + (settings + sys.platform).encode('utf-8')).hexdigest()[:16]
+	libDir = os.path.abspath(os.path.join(cacheDir, key))
+	if os.path.exists(os.path.join(libDir, 'complete')):
+		return libDir
+	if not os.path.exists(libDir):
+		os.makedirs(libDir)
+	fileName = 'usub' + os.path.splitext(source)[1]
+	shutil.copyfile(source, os.path.join(libDir, fileName))
+	runCommand = ['abaqus', 'make', 'library='+fileName]
+	if os.name == 'nt':
+		runCommand = ['cmd.exe', '/c'] + runCommand
+	print('Compiling ' + source + ' to ' + libDir)
+	process = subprocess.Popen(runCommand, cwd=libDir)
+	if process.wait() != 0:
+		raise RuntimeError('Compilation of ' + source + ' failed with exit status ' + str(process.returncode))
+	# Marking the library as complete for other processes
+	open(os.path.join(libDir, 'complete'), 'w').close()
+	return libDir
+
+def abqRelease():
+	"""
+
+	**Release information of the installed Abaqus.**
+
+	:return:
+
+		(`str`) Output of ``abaqus information=release``, used by :func:`run_sim` to compile a new user subroutine library with :func:`abqLibrary` after an Abaqus update. An empty string if the command fails.
+
+	.. admonition:: Metadata
+
+		.. tabbed:: Environment
+
+			:badge:`Python,badge-primary`
+
+		.. tabbed:: Version
+
+			v1.2.0
+
+		.. tabbed:: Date
+
+			2026-10-19
+
+	"""
+	import os
+	import subprocess
+	runCommand = ['abaqus', 'information=release']
+	if os.name == 'nt':
+		runCommand = ['cmd.exe', '/c'] + runCommand
+	try:
+		process = subprocess.Popen(runCommand, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+		output = process.communicate()[0]
+	except OSError:
+		return ''
+	if process.returncode != 0:
+		return ''
+	return output.decode('latin-1').strip()
+
+# Modules of the abaqus_modules functions that only need the ODB API
+OdbFunctions = {
+	'czmtestkit.abaqus_modules.historyOutput': 'czmtestkit.abaqus_modules.postProc.historyOutput',
+	'czmtestkit.abaqus_modules.interfaceDamage': 'czmtestkit.abaqus_modules.postProc.interfaceDamage',
+}
+
+def abqPython(points, function, nJobs=1):
+	"""
+
+	**Run an abaqus-python function for several tests with the** ``abaqus python`` **interpreter.**
+
+	Functions that only need the ODB API (``odbAccess``), such as :func:`czmtestkit.abaqus_modules.historyOutput`, do not require an Abaqus/CAE session.
+	The tests are divided into `nJobs` batches and each batch is executed by one ``abaqus python`` process, which calls `function` for all tests of the batch.
+	The batches run concurrently.
+	`function` is given with the path of its module, e.g. ``'czmtestkit.abaqus_modules.postProc.historyOutput'``. The module is imported without the ``__init__.py`` of its package, which imports the Abaqus/CAE modules.
+	The functions in ``OdbFunctions`` (:func:`czmtestkit.abaqus_modules.historyOutput` and :func:`czmtestkit.abaqus_modules.interfaceDamage`) can also be given with the package path.
+	Errors are printed and do not stop the remaining tests of the batch.
+
+	:Parameters:
+
+		**points** (`list`): Tuples with the work directory and the ``.json`` file name with the input dictionary of each test.
+
+		**function** (`str`): Name of the abaqus-python function with the path of its module, e.g. ``'czmtestkit.abaqus_modules.postProc.historyOutput'``.
+
+		**nJobs** (`int`): Number of concurrent ``abaqus python`` processes.
+
+	:return:
+
+		**returncodes** (`list`): Exit status of each process.
+
+	.. dropdown:: Example
+
+		.. code-block:: python
+
+			points = [(os.path.join('ExampleDOE', 'point_{0:02d}'.format(i)), 'point_{0:02d}.json'.format(i)) for i in range(200)]
+			abqPython(points, 'czmtestkit.abaqus_modules.historyOutput', nJobs=4)
+
+	.. admonition:: Metadata
+
+		.. tabbed:: Environment
+
+			:badge:`Python,badge-primary`
+
+		.. tabbed:: Version
+
+			v1.2.0
+
+		.. tabbed:: Date
+
+			2026-10-19
+
+	"""
+	import os
+	import sys
+	import tempfile
+	import subprocess
+	import importlib.util
+	function = OdbFunctions.get(function, function)
+	funcPath = function.split('.')
+	func = funcPath[-1]
+	fPath = '.'.join(funcPath[:-1])
+	package = None
+	parent = '.'.join(funcPath[:-2])
+	if parent != '':
+		spec = importlib.util.find_spec(parent)
+		if spec is not None and spec.submodule_search_locations is not None:
+			# The module is imported without the __init__.py of its package
+			package = parent
+			packageDir = list(spec.submodule_search_locations)[0]
+			if os.path.isdir(os.path.join(packageDir, funcPath[-2])):
+				raise ValueError(function+' is not a function of a module, give the module path, e.g. czmtestkit.abaqus_modules.postProc.historyOutput')
+	points = [(os.path.abspath(wd), InputData) for wd, InputData in points]
+	processes = []
+	scriptNames = []
+	for k in range(min(nJobs, len(points))):
+		# Unique script names for concurrent calls from the same directory
+		handle, scriptName = tempfile.mkstemp(prefix='abqPythonScript_'+str(k)+'_', suffix='.py', dir=os.getcwd())
+		os.close(handle)
+		scriptNames.append(scriptName)
+		with open(scriptName, 'w') as file:
+			file.write("import os\n")
+			file.write("import sys\n")
+			file.write("import json\n")
+			file.write("import types\n")
+			file.write("sys.path.extend("+ str(sys.path) +")\n")
+			file.write("sys.path.extend([os.getcwd()])\n")
+			file.write("cwd = os.getcwd()\n")
+			if package is not None:
+				file.write("package = types.ModuleType('"+package+"')\n")
+				file.write("package.__path__ = [r\'"+packageDir.encode('unicode-escape').decode()+"\']\n")
+				file.write("sys.modules['"+package+"'] = package\n")
+			file.write("from "+fPath+" import "+func+"\n")
+			file.write("points = "+repr(points[k::nJobs])+"\n")
+			file.write("for wd, fileName in points:\n")
+			file.write("	try:\n")
+			file.write("		os.chdir(wd)\n")
+			file.write("		with open(fileName, 'r') as inputFile:\n")
+			file.write("			dict = json.load(inputFile)\n")
+			file.write("		"+func+"(dict)\n")
+			file.write("	except Exception as e:\n")
+			file.write("		print('"+func+" failed in ' + wd + ': ' + str(e))\n")
+			file.write("	os.chdir(cwd)\n")
+		runCommand = ['abaqus', 'python', scriptName]
+		if os.name == 'nt':
+			runCommand = ['cmd.exe', '/c'] + runCommand
+		processes.append(subprocess.Popen(runCommand))
+	returncodes = [process.wait() for process in processes]
+	for scriptName in scriptNames:
+		os.remove(scriptName)
+	return returncodes
@@ -2,16 +2,21 @@ def Results(dict):
     """
     **Calculates the effective displacement and reaction force from history output.**
 
+    The history output is read with :func:`resultArrays`, which parses the ``.csv`` or ``.npz`` file once and caches the arrays next to it.
+    Only the curves of the first node are returned, as lists, such that the output can be saved to the ``.json`` files of the design of experiments.
+
     :Parameters:
 
         **dict** (`dict`): Input data for the instance in the design of experiments required to execute :func:`Results` functions.
 
             :Keys: Values
 
-            :'JobID': (`str`) File name of the `.csv` file with history output of reaction force and displacement extracted from the `.odb` file.
+            :'JobID': (`str`) File name of the `.csv` or `.npz` file with history output of reaction force and displacement extracted from the `.odb` file.
 
             :'Width': (`float`) Since the CAE models are of unit width, the results are adjusted using the actual width as a multiplier.
 
+            :'symmetric': (`bool`) [optional] ``True`` if the history output is from the half-symmetry model :func:`czmtestkit.abaqus_modules.ADCBsym`. The displacement of the modelled arm is doubled to recover the opening displacement, while the reaction force on the arm already equals the reaction force of the full specimen.
+
 	
     :return:
         
@@ -77,11 +82,15 @@ def Results(dict):
 
         .. tabbed:: Version
             
-            v1.0.0
+            ==========  =====
+            **v1.2.0**  Vectorised with NumPy using :func:`resultArrays`, without pandas. Reads ``<JobID>.npz`` if there is no newer ``<JobID>.csv``.
+
+            v1.0.0      Initial release.
+            ==========  =====
 
         .. tabbed:: Date
             
-            2021-06-18
+            2026-10-19
 
         .. tabbed:: Authors
             
@@ -93,34 +102,117 @@ def Results(dict):
 
     """
     
+    Output = resultArrays(dict)
+    if Output is None:
+        print("The file does not exist")
+        return None
+    OutputData = {'NodeSet':Output['NodeSet'], 'Reaction Force':Output['Reaction Force'][0].tolist(), 'Displacement':Output['Displacement'][0].tolist()}
+    return OutputData
+
+def resultArrays(dict):
+    """
+    **Effective displacement and reaction force of all nodes in the history output as arrays.**
+
+    The history output ``<JobID>.csv`` (or ``<JobID>.npz`` if it is newer or the only file, see :func:`czmtestkit.abaqus_modules.historyOutput`) is parsed once and the components are saved to ``<JobID>_results.npz``.
+    Later calls load this file as long as the size and the modification time of the history output are unchanged, e.g. after :func:`appendHistory` the history output is parsed again.
+    The magnitudes of all nodes and outputs are computed in one operation.
+
+    :Parameters:
+
+        **dict** (`dict`): Input data of the test, see :func:`Results`.
+
+    :return:
+
+        **OutputData** (`dict`): History output data. ``None`` if neither file exists.
+
+            :'NodeSet': (`list`) Names of the nodes in the history output.
+
+            :'Reaction Force': (`numpy.ndarray`) Magnitude of the reaction force effective over the total specimen width, one row per node.
+
+            :'Displacement': (`numpy.ndarray`) Opening displacement, one row per node.
+
+            :'Time': (`numpy.ndarray`) Total time of each row. Only for ``.npz`` history output, otherwise ``None``.
+
+    .. dropdown:: Example
+
+        .. code-block:: python
+
+            Output = resultArrays({'JobID': 'ExampleJob', 'Width': 25})
+            for i in range(len(Output['NodeSet'])):
+                print(Output['NodeSet'][i], Output['Reaction Force'][i].max())
+
+    .. admonition:: Metadata
+
+        .. tabbed:: Environment
+
+            :badge:`Python,badge-primary`
+
+        .. tabbed:: Version
+
+            v1.2.0
+
+        .. tabbed:: Date
+
+            2026-10-19
+
+    """
+    import numpy as np
+    History = _historyArrays(dict['JobID'])
+    if History is None:
+        return None
+    Outputs = History['Outputs'].tolist()
+    # Magnitude over the components (nan if a node has fewer components)
+    Effective = np.sqrt(np.nansum(History['Data']**2, axis=2))
+    ReactionForce = dict['Width']*Effective[:,Outputs.index('RF')]
+    Displacement = Effective[:,Outputs.index('U')]
+    if dict.get('symmetric') is True:
+        Displacement = 2*Displacement
+    Time = History['Time'] if len(History['Time']) != 0 else None
+    return {'NodeSet':History['Nodes'].tolist(), 'Reaction Force':ReactionForce, 'Displacement':Displacement, 'Time':Time}
+
+def _historyArrays(Name):
+    """
+    Components of the history output of `Name` as the array ``'Data'`` with the shape (nodes, outputs, components, rows), cached in ``<Name>_results.npz``.
+    """
     import os
     import numpy as np
-    import pandas as pd
-
-    Name = dict['JobID']
-    Width = dict['Width']
-
-    if os.path.exists(Name+'.csv'):
-        data = pd.read_csv(Name+'.csv', header=None)
-        Data = data.loc[3:]
-        Ind = data.loc[0:2].values.tolist()
-        Head = [[], [], []]
-        for i in range(3):
-            Head[i] = list(sorted(set(Ind[i]), key=Ind[i].index))
-        header = pd.MultiIndex.from_product(Head, names=['Node','Output','Direction'])
-        Data.columns = header
-        Data = Data.astype(float)
-        for i in Head[0]:
-            for j in Head[1]:
-                Data[i,j,'Effective'] = (Data.xs(i,level='Node',axis=1).xs(j,level='Output',axis=1)**2).sum(axis=1)**0.5
-        NodeSet = list(Data.columns.levels[0])
-        Results = Data.xs('Effective',level='Direction',axis=1)   
-        ReactionForce = Results.xs('RF',level='Output',axis=1)   
-        ReactionForce = ReactionForce.apply(lambda x: x*Width).to_numpy().transpose()
-        Displacement = Results.xs('U',level='Output',axis=1).to_numpy().transpose()
-        ReactionForce = ReactionForce.tolist()
-        Displacement = Displacement.tolist()
-        OutputData = {'NodeSet':NodeSet, 'Reaction Force':ReactionForce[0], 'Displacement':Displacement[0]}
-        return OutputData
+    Sources = [Name+'.'+ext for ext in ['csv', 'npz'] if os.path.exists(Name+'.'+ext)]
+    if len(Sources) == 0:
+        return None
+    Source = max(Sources, key=os.path.getmtime)
+    stat = os.stat(Source)
+    cacheFile = Name+'_results.npz'
+    if os.path.exists(cacheFile):
+        with np.load(cacheFile) as Cache:
+            History = {key: Cache[key] for key in Cache.files}
+        if str(History['Source']) == os.path.basename(Source) and int(History['Size']) == stat.st_size and float(History['Mtime']) == stat.st_mtime:
+            return History
+    Time = np.zeros(0)
+    if Source.endswith('.csv'):
+        import csv
+        # Files written on Windows end lines with '\r\r\n', the empty lines are skipped
+        with open(Source, 'rb') as file:
+            Lines = [line.decode('latin-1').strip() for line in file]
+        Lines = [line for line in Lines if line != '']
+        Header = list(csv.reader(Lines[:3]))
+        Values = np.loadtxt(Lines[3:], delimiter=',', ndmin=2).T
     else:
-        print("The file does not exist")
\ No newline at end of file
+        with np.load(Source) as Arrays:
+            Keys = [key for key in Arrays.files if key[-1].isdigit()]
+            Header = [[key.rsplit(':', 1)[0] for key in Keys], [key.rsplit(':', 1)[1][:-1] for key in Keys], [key[-1] for key in Keys]]
+            Values = np.array([Arrays[key][:,1] for key in Keys])
+            if len(Keys) != 0:
+                Time = Arrays[Keys[0]][:,0]
+    # Position of each column in the (nodes, outputs, components) grid
+    Labels = []
+    Index = []
+    for row in Header:
+        labels = sorted(set(row), key=row.index)
+        Labels.append(labels)
+        Index.append([labels.index(label) for label in row])
+    Data = np.full((len(Labels[0]), len(Labels[1]), len(Labels[2]), Values.shape[1]), np.nan)
+    Data[Index[0], Index[1], Index[2]] = Values
+    History = {'Nodes': np.array(Labels[0]), 'Outputs': np.array(Labels[1]), 'Components': np.array(Labels[2]), 'Data': Data, 'Time': Time,
+        'Source': np.array(os.path.basename(Source)), 'Size': np.array(stat.st_size), 'Mtime': np.array(stat.st_mtime)}
+    np.savez(cacheFile, **History)
+    return History
@@ -0,0 +1,21 @@
+import os
+import shutil
+import czmtestkit.py_modules as py_modules
+from czmtestkit.py_modules import viscosityCalibration
+
+Example = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'Examples', 'ADCB_AbqImp')
+
+def test_viscosityCalibration(tmp_path, monkeypatch):
+    # Finished tests from the example instead of Abaqus jobs
+    name = str(tmp_path / 'Calibration')
+    for i in range(5):
+        path = os.path.join(name, 'point_{0:02d}'.format(i))
+        os.makedirs(path)
+        for ext in ['.csv', '.dat']:
+            shutil.copy(os.path.join(Example, 'point_{0:02d}'.format(min(i, 2)), 'ADCB_AbqImp'+ext), path)
+    monkeypatch.setattr(py_modules, 'run_sim', lambda *args, **kwargs: None)
+    output = viscosityCalibration(name, {'JobID': 'ADCB_AbqImp', 'Width': 25, 'MeshX': 0.5}, tolerance=0.05)
+    Reference = output['Viscosities'][0]
+    assert Reference['Peak Load'] > 0 and Reference['Energy'] > 0 and Reference['Runtime'] is not None
+    assert output['Viscosities'][1]['Energy Error'] > 0
+    assert output['Recommended'] == 1e-2
@@ -0,0 +1,22 @@
+import os
+import glob
+import shutil
+import numpy as np
+from czmtestkit.py_modules import Results, resultArrays
+
+Examples = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'Examples')
+
+def test_Results_examples(tmp_path):
+    csvFiles = sorted(glob.glob(os.path.join(Examples, '*', 'point_*', '*.csv')))
+    assert len(csvFiles) != 0
+    for i, csvFile in enumerate(csvFiles):
+        JobID = str(tmp_path / ('Job{0}'.format(i)))
+        shutil.copy(csvFile, JobID+'.csv')
+        Output = Results({'JobID': JobID, 'Width': 25})
+        assert Output['NodeSet'] == ['Node ASSEMBLY.2']
+        assert len(Output['Reaction Force']) == len(Output['Displacement']) > 1
+        assert Output['Displacement'][0] == 0.0
+        # Second call from the cache
+        Arrays = resultArrays({'JobID': JobID, 'Width': 25})
+        assert os.path.exists(JobID+'_results.npz')
+        assert np.allclose(Arrays['Reaction Force'][0], Output['Reaction Force'])